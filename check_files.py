@@ -5,64 +5,119 @@ are present in the correct directory structure. It provides helpful error
 messages and setup commands if any files are missing.
 """
 
+from functools import lru_cache
 from pathlib import Path
+import os
 import sys
-from typing import List, Tuple
+import time
+from typing import Dict, FrozenSet, List, Set
+
+# Seconds a cached existence check stays valid
+STAT_CACHE_TTL = 5.0
+
+@lru_cache(maxsize=512)
+def _exists(path_str: str, epoch: int) -> bool:
+    """Cached existence check; ``epoch`` buckets calls into TTL windows."""
+    return os.path.exists(path_str)
+
+def path_exists(path: Path) -> bool:
+    """
+        Check whether a path exists, reusing results within STAT_CACHE_TTL.
+        
+        Call ``_exists.cache_clear()`` when a fresh answer is required.
+        
+        Args:
+            path: Path to check
+        
+        Returns:
+            bool: True if the path exists
+    """
+    epoch = int(time.monotonic() // STAT_CACHE_TTL)
+    return _exists(os.path.abspath(path), epoch)
+
+# All required files for the project
+# Files are listed in logical groups for better maintenance
+REQUIRED_FILES = frozenset({
+    # Core package files
+    'src/__init__.py',
+    'src/cli.py',
+    
+    # CLI subcommands, loaded on demand by the cli group
+    'src/commands/__init__.py',
+    'src/commands/analyze.py',
+    'src/commands/visualize.py',
+    'src/commands/configure.py',
+    'src/commands/version.py',
+    
+    # Apex analysis modules
+    'src/apex/__init__.py',
+    'src/apex/parser.py',
+    'src/apex/analyzer.py',
+    
+    # Data models
+    'src/models/__init__.py',
+    'src/models/apex_models.py',
+    'src/models/analysis_models.py',
+    
+    # Automation analysis modules
+    'src/automations/__init__.py',
+    
+    # Execution path analysis and visualization
+    'src/execution/__init__.py',
+    'src/execution/path_analyzer.py',
+    'src/execution/visualizer.py',
+    
+    # LLM integration
+    'src/llm/__init__.py',
+    'src/llm/documenter.py',
+    
+    # Utility modules
+    'src/utils/__init__.py',
+    'src/utils/metadata_scan.py',
+    'src/utils/parse_cache.py',
+    'src/utils/sfdx_helper.py',
+    
+    # Configuration
+    'config/default_config.yaml'
+})
+
+# Required file names grouped by parent directory, so each directory is read once
+_FILES_BY_DIR: Dict[str, FrozenSet[str]] = {}
+for _path in sorted(REQUIRED_FILES):
+    _directory, _name = os.path.split(_path)
+    _FILES_BY_DIR[_directory] = _FILES_BY_DIR.get(_directory, frozenset()) | {_name}
+
+def _scan_dir(directory: str) -> Set[str]:
+    """
+        List the entry names of a directory with a single scandir call.
+        
+        Args:
+            directory: Directory to list
+        
+        Returns:
+            Set[str]: Entry names, empty if the directory does not exist
+    """
+    if not path_exists(Path(directory)):
+        return set()
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
 
 def check_files() -> bool:
     """Verify the existence of all required project files.
     
     Checks for the presence of all necessary Python modules, package files,
-    and configuration files in the expected directory structure. The function
-    maintains a comprehensive list of required files and their expected locations.
+    and configuration files in the expected directory structure, as listed
+    in REQUIRED_FILES. Each directory is listed once and diffed against the
+    file names expected in it.
     
     Returns:
         bool: True if all required files are present, False otherwise.
     """
-    # Define all required files for the project
-    # Files are listed in logical groups for better maintenance
-    required_files = [
-        # Core package files
-        'src/__init__.py',
-        'src/cli.py',
-        
-        # Apex analysis modules
-        'src/apex/__init__.py',
-        'src/apex/parser.py',
-        'src/apex/analyzer.py',
-        
-        # Data models
-        'src/models/__init__.py',
-        'src/models/apex_models.py',
-        'src/models/analysis_models.py',
-        
-        # Automation analysis modules
-        'src/automations/__init__.py',
-        
-        # Execution path analysis and visualization
-        'src/execution/__init__.py',
-        'src/execution/path_analyzer.py',
-        'src/execution/visualizer.py',
-        
-        # LLM integration
-        'src/llm/__init__.py',
-        'src/llm/documenter.py',
-        
-        # Utility modules
-        'src/utils/__init__.py',
-        'src/utils/sfdx_helper.py',
-        
-        # Configuration
-        'config/default_config.yaml'
+    missing = [
+        f"{directory}/{name}"
+        for directory, expected in _FILES_BY_DIR.items()
+        for name in sorted(expected - _scan_dir(directory))
     ]
-
-    # Track missing files
-    missing = []
-    
-    # Check each required file
-    for file in required_files:
-        if not Path(file).exists():
-            missing.append(file)
     
     # Report results
     if missing:
@@ -86,37 +141,55 @@ def generate_setup_commands(indent: int = 0) -> List[str]:
         Returns:
             List[str]: Shell commands to create project structure
     """
-    # Define directory structure and file creation commands
-    commands = [
-        # Create directory structure
-        "mkdir -p src/apex src/models src/automations src/execution src/llm src/utils config",
-        # Create core package files
-        "touch src/__init__.py src/cli.py",
-        # Create Apex analysis files
-        "touch src/apex/__init__.py src/apex/parser.py src/apex/analyzer.py",
-        # Create model files
-        "touch src/models/__init__.py src/models/apex_models.py src/models/analysis_models.py",
-        # Create automation files
-        "touch src/automations/__init__.py",
-        # Create execution analysis files
-        "touch src/execution/__init__.py src/execution/path_analyzer.py src/execution/visualizer.py",
-        # Create LLM integration files
-        "touch src/llm/__init__.py src/llm/documenter.py",
-        # Create utility files
-        "touch src/utils/__init__.py src/utils/sfdx_helper.py",
-        # Create configuration file
-        "touch config/default_config.yaml"
-    ]
+    # Create the directory structure, then the files of each directory
+    commands = ["mkdir -p " + " ".join(directory for directory in _FILES_BY_DIR if directory)]
+    commands.extend(
+        "touch " + " ".join(f"{directory}/{name}" for name in sorted(names))
+        for directory, names in _FILES_BY_DIR.items()
+    )
     
     # Apply indentation if requested
     if indent > 0:
         return [" " * indent + cmd for cmd in commands]
     return commands
 
+def apply_setup() -> List[str]:
+    """
+        Create the missing project structure directly, without spawning a shell.
+        
+        Creates every required directory and creates empty files for any required
+        file that does not exist yet. Existing files are left untouched.
+        
+        Returns:
+            List[str]: Paths of the files that were created
+    """
+    created = []
+    for directory, names in _FILES_BY_DIR.items():
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for name in sorted(names):
+            file_path = os.path.join(directory, name)
+            try:
+                fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            created.append(file_path)
+    # Directory listings may have changed
+    _exists.cache_clear()
+    return created
+
 if __name__ == "__main__":
     # When run as a script, check files and provide setup instructions if needed
     if not check_files():
+        if '--apply' in sys.argv[1:]:
+            # Create the missing structure in-process
+            for file_path in apply_setup():
+                print(f"Created {file_path}")
+            sys.exit(0)
+        
         print("\nRun these commands to create missing files:")
+        print("(or rerun with --apply to create them directly)")
         
         # Print each setup command on a new line
         for command in generate_setup_commands():
@@ -6,11 +6,44 @@
     It helps diagnose configuration issues with detailed error reporting.
 """
 
+from functools import lru_cache
 from pathlib import Path
+import os
+import time
 import yaml
 import sys
 from typing import Dict, List, Tuple, Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Seconds a cached existence check stays valid
+STAT_CACHE_TTL = 5.0
+
+@lru_cache(maxsize=512)
+def _stat(path_str: str, epoch: int) -> Optional[os.stat_result]:
+    """Cached stat; ``epoch`` buckets calls into TTL windows."""
+    try:
+        return os.stat(path_str)
+    except OSError:
+        return None
+
+def path_stat(path: Path) -> Optional[os.stat_result]:
+    """
+        Stat a path, reusing results within STAT_CACHE_TTL.
+        
+        A single cached stat answers both existence and size questions.
+        Call ``_stat.cache_clear()`` when a fresh answer is required.
+        
+        Returns:
+            Optional[os.stat_result]: Stat result, None if the path does not exist
+    """
+    epoch = int(time.monotonic() // STAT_CACHE_TTL)
+    return _stat(os.path.abspath(path), epoch)
+
 def debug_config() -> Optional[Dict]:
     """
         Debug and validate the analyzer configuration file.
@@ -51,15 +84,16 @@ def debug_config() -> Optional[Dict]:
     
     print("\n=== Checking Configuration ===\n")
     
-    # Step 1: Verify file existence and basic properties
-    print(f"1. Checking if config file exists at: {config_path.absolute()}")
-    if not config_path.exists():
+    # Step 1: Verify file existence and basic properties with one stat call
+    print(f"1. Checking if config file exists at: {os.path.abspath(config_path)}")
+    config_stat = path_stat(config_path)
+    if config_stat is None:
         print(f"❌ Config file not found!")
         return None
     else:
         print(f"✅ Config file found")
         # Report file size to help identify empty or truncated files
-        print(f"File size: {config_path.stat().st_size} bytes")
+        print(f"File size: {config_stat.st_size} bytes")
     
     # Step 2: Verify file readability and content
     print("\n2. Reading config file content:")
@@ -80,8 +114,8 @@ def debug_config() -> Optional[Dict]:
     # Step 3: Validate YAML structure and required sections
     print("\n3. Attempting to parse YAML:")
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Parse the buffer already read in step 2 rather than reopening the file
+        config = yaml.load(raw_content, Loader=SafeLoader)
             
         # Verify all required configuration sections are present
         required_sections = ['analysis', 'execution', 'visualization', 'llm']
@@ -6,13 +6,132 @@
     execution paths, recursion risks, and automation entry points.
 """
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Set, Optional
+from functools import partial
+from typing import Any, Callable, FrozenSet, Iterator, List, Dict, Sequence, Set, Optional, Tuple
 from pathlib import Path
-from .parser import ApexParser, ApexClass, ApexMethod
+from .parser import (
+    PARALLEL_PARSE_THRESHOLD, PARSER_VERSION, ApexParser, ApexClass,
+    _get_worker_parser, _mask_noncode, _pool_chunksize, _read_source
+)
+from ..utils.metadata_scan import context_str, iter_files, trigger_header
+from ..utils.parse_cache import ParseCache
+import logging
+import os
 import re
+import sys
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Conventional location of the on-disk parse cache, for callers that opt in
+DEFAULT_CACHE_DIR = Path('.apex_cache')
+# Bump when trigger parse results change shape so stale cache entries are ignored;
+# class results are invalidated through PARSER_VERSION
+_CACHE_VERSION = f'2-{PARSER_VERSION}'
+
+# Identifiers referenced in a trigger body (scanned once per trigger). Apex
+# identifiers start with a letter, so numeric literals are never collected.
+_IDENTIFIER_RE = re.compile(rb'\b[A-Za-z]\w*')
+# Target of a DML statement, e.g. 'update Account' (Apex keywords are case-insensitive)
+_DML_TARGET_RE = re.compile(r'\b(?:insert|update|delete)\s+(\w+)', re.IGNORECASE | re.ASCII)
+
+def _parse_class_file(class_file: Path, raw: bytes) -> Optional[ApexClass]:
+    """
+        Parse an Apex class file with the process-wide parser.
+        
+        Module-level so it can be dispatched to worker processes without
+        pickling an analyzer or parser instance.
+        
+        Args:
+            class_file: Path to the class file
+            raw: Content of the class file
+            
+        Returns:
+            Optional[ApexClass]: Parsed class, None if parsing fails
+    """
+    return _get_worker_parser().parse_source(class_file, raw)
+
+def _load_or_parse(source_file: Path, parse: Callable[[Path, bytes], Any],
+                   cache: Optional[ParseCache]) -> Any:
+    """
+        Return the cached parse result for a file, parsing it on a miss.
+        
+        The file is read once; the same bytes key the cache entry and are
+        handed to the parse function. Entries are keyed by the file's path and
+        content, so any edit to the file invalidates its entry. Failed parses
+        (None) are not cached.
+        
+        Args:
+            source_file: File to parse
+            parse: Parse function for the file type, taking the path and content
+            cache: Cache to consult, or None to always parse
+            
+        Returns:
+            Any: Result of parse(source_file, content), None if the file cannot be read
+    """
+    try:
+        raw = _read_source(source_file)
+    except OSError as e:
+        logger.error(f"Error reading {source_file}: {str(e)}")
+        return None
+    if cache is None:
+        return parse(source_file, raw)
+    key = cache.key(os.fsencode(source_file), raw)
+    result = cache.get(key)
+    if result is None:
+        result = parse(source_file, raw)
+        if result is not None:
+            cache.put(key, result)
+    return result
+
+def _parse_trigger_file(trigger_file: Path, raw: Optional[bytes] = None) -> Optional[Tuple[str, Dict]]:
+    """
+        Parse a trigger file to extract its metadata.
+        
+        Args:
+            trigger_file: Path to the trigger file
+            raw: Content of the trigger file, read from trigger_file when None
+            
+        Returns:
+            Optional[Tuple[str, Dict]]: Trigger name and data, None if the file
+            has no trigger header or cannot be parsed
+            
+        Note:
+            Extracts:
+            - Trigger name
+            - Object context
+            - Execution contexts (as a TRIGGER_CONTEXT_BITS bitmask)
+            - Full content for analysis
+            - Identifiers referenced by the body (narrowed to known
+              classes as 'class_references' once loading completes)
+            
+            The content is matched as bytes; only the header groups are
+            decoded and the raw content is kept as bytes.
+    """
+    try:
+        content = _read_source(trigger_file) if raw is None else raw
+        # Extract trigger name and contexts
+        header = trigger_header(content)
+        if header is None:
+            return None
+        name, object_name, contexts = header
+        # Distinct identifiers in order of first appearance, decoded once each
+        identifiers = dict.fromkeys(_IDENTIFIER_RE.findall(content))
+        return name, {
+            'object': object_name,
+            'contexts': contexts,
+            'content': content,
+            'references': tuple(
+                sys.intern(identifier.decode('ascii')) for identifier in identifiers
+            )
+        }
+    except Exception as e:
+        logger.error(f"Error parsing trigger {trigger_file}: {str(e)}")
+        return None
+
+@dataclass(slots=True, frozen=True)
 class TriggerContext:
     """
         Represents a Salesforce trigger execution context.
@@ -22,6 +141,8 @@ class TriggerContext:
             context: Trigger timing and operation (e.g., 'before insert')
             trigger_name: Name of the trigger being executed
             
+        Instances are immutable and hashable, so they can be used as keys.
+            
         Example:
             >>> context = TriggerContext(
             ...     object_name='Account',
@@ -33,7 +154,7 @@ class TriggerContext:
     context: str  # before/after insert/update/delete/undelete
     trigger_name: str
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionNode:
     """
         Represents a node in the automation execution path.
@@ -42,7 +163,8 @@ class ExecutionNode:
             component_type: Type of automation component
             name: Name of the component
             method: Optional method name for class components
-            next_nodes: List of nodes executed after this one
+            next_nodes: Nodes executed after this one; the shared empty tuple
+                for leaves, a list once add_child has been called
             conditions: Optional execution conditions
             order: Execution order in the path
             
@@ -51,18 +173,152 @@ class ExecutionNode:
             ...     component_type='trigger',
             ...     name='AccountTrigger',
             ...     method=None,
-            ...     next_nodes=[],
+            ...     next_nodes=(),
             ...     conditions=None,
             ...     order=0
             ... )
+            >>> node.add_child(class_node)
     """
     component_type: str  # 'trigger', 'class', 'flow', 'process_builder', 'workflow'
     name: str
     method: Optional[str]
-    next_nodes: List['ExecutionNode']
+    next_nodes: Sequence['ExecutionNode']
     conditions: Optional[str]
     order: int
 
+    def add_child(self, node: 'ExecutionNode'):
+        """Append a node to next_nodes, allocating the list on first use."""
+        if self.next_nodes:
+            self.next_nodes.append(node)
+        else:
+            self.next_nodes = [node]
+
+class ExecutionGraph:
+    """
+        Compact, column-oriented copy of one or more execution paths.
+        
+        Each node is an integer ID indexing parallel columns; children are stored
+        in a single flat array with CSR-style offsets. Nodes shared between paths
+        (such as reused class subpaths) are stored once.
+        
+        Attributes:
+            component_type: Component type of each node (interned)
+            name: Component name of each node
+            method: Method name of each node, if any
+            conditions: Execution conditions of each node, if any
+            order: Execution order of each node
+            child_offsets: Start of each node's children in children; node i's
+                children are children[child_offsets[i]:child_offsets[i + 1]]
+            children: Child node IDs of every node, concatenated
+            roots: IDs of the top-level path nodes
+            
+        Example:
+            >>> graph = ExecutionGraph.from_path(analyzer.build_execution_path(context))
+            >>> for child in graph.child_ids(graph.roots[0]):
+            ...     print(graph.name[child], graph.order[child])
+    """
+    
+    __slots__ = ('component_type', 'name', 'method', 'conditions', 'order',
+                 'child_offsets', 'children', 'roots')
+    
+    def __init__(self):
+        self.component_type: List[str] = []
+        self.name: List[str] = []
+        self.method: List[Optional[str]] = []
+        self.conditions: List[Optional[str]] = []
+        self.order = array('i')
+        self.child_offsets = array('i', [0])
+        self.children = array('i')
+        self.roots: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    @classmethod
+    def from_path(cls, path: List[ExecutionNode]) -> 'ExecutionGraph':
+        """
+            Build a graph from the nodes of an execution path.
+            
+            Args:
+                path: Top-level nodes, as returned by build_execution_path
+                
+            Returns:
+                ExecutionGraph: Graph holding every node reachable from the path
+        """
+        graph = cls()
+        ids: Dict[int, int] = {}  # id(node) -> node ID
+        nodes: List[ExecutionNode] = []
+        
+        # Number nodes in depth-first preorder, visiting shared nodes once
+        stack = list(reversed(path))
+        while stack:
+            node = stack.pop()
+            if id(node) in ids:
+                continue
+            ids[id(node)] = len(nodes)
+            nodes.append(node)
+            stack.extend(reversed(node.next_nodes))
+        
+        for node in nodes:
+            graph.component_type.append(sys.intern(node.component_type))
+            graph.name.append(node.name)
+            graph.method.append(node.method)
+            graph.conditions.append(node.conditions)
+            graph.order.append(node.order)
+            graph.children.extend(ids[id(child)] for child in node.next_nodes)
+            graph.child_offsets.append(len(graph.children))
+        graph.roots = [ids[id(node)] for node in path]
+        return graph
+
+    def child_ids(self, node_id: int) -> array:
+        """Child node IDs of a node, in execution order."""
+        return self.children[self.child_offsets[node_id]:self.child_offsets[node_id + 1]]
+
+    def view(self, node_id: int) -> 'ExecutionNodeView':
+        """Read-only ExecutionNode-like view of a node."""
+        return ExecutionNodeView(self, node_id)
+
+class ExecutionNodeView:
+    """
+        Read-only view of an ExecutionGraph node with the ExecutionNode attributes.
+        
+        Attributes:
+            node_id: ID of the node in its graph
+    """
+    
+    __slots__ = ('_graph', 'node_id')
+    
+    def __init__(self, graph: ExecutionGraph, node_id: int):
+        self._graph = graph
+        self.node_id = node_id
+
+    @property
+    def component_type(self) -> str:
+        return self._graph.component_type[self.node_id]
+
+    @property
+    def name(self) -> str:
+        return self._graph.name[self.node_id]
+
+    @property
+    def method(self) -> Optional[str]:
+        return self._graph.method[self.node_id]
+
+    @property
+    def conditions(self) -> Optional[str]:
+        return self._graph.conditions[self.node_id]
+
+    @property
+    def order(self) -> int:
+        return self._graph.order[self.node_id]
+
+    @property
+    def next_nodes(self) -> List['ExecutionNodeView']:
+        return [ExecutionNodeView(self._graph, child) for child in self._graph.child_ids(self.node_id)]
+
+    def __repr__(self) -> str:
+        return f"ExecutionNodeView({self.component_type!r}, {self.name!r}, order={self.order})"
+
 class ApexAnalyzer:
     """
         Analyzer for Apex code that builds execution paths and identifies dependencies.
@@ -74,6 +330,7 @@ class ApexAnalyzer:
         
         Attributes:
             parser: Parser for Apex code files
+            cache: On-disk parse cache, None when caching is disabled
             classes: Dictionary of parsed Apex classes
             triggers: Dictionary of parsed triggers
             execution_paths: Mapped execution paths by context
@@ -82,74 +339,154 @@ class ApexAnalyzer:
             >>> analyzer = ApexAnalyzer()
             >>> analyzer.load_source(Path('./force-app/main/default'))
             >>> paths = analyzer.build_execution_path(trigger_context)
+            >>> # Reuse parse results across runs (opt-in)
+            >>> cached = ApexAnalyzer(cache_dir=DEFAULT_CACHE_DIR)
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
         """
             Initialize the Apex analyzer.
+            
+            Args:
+                cache_dir: Directory for cached parse results, None (the default)
+                    to disable caching. Entries are unpickled when read, so only
+                    point this at a directory you trust.
         """
         self.parser = ApexParser()
+        self.cache = ParseCache(cache_dir, _CACHE_VERSION) if cache_dir is not None else None
         self.classes: Dict[str, ApexClass] = {}
         self.triggers: Dict[str, Dict] = {}
         self.execution_paths: Dict[str, List[ExecutionNode]] = {}
+        # Class name -> known classes it calls, rebuilt by load_source
+        self._class_call_graph: Dict[str, Tuple[str, ...]] = {}
+        # Dense class IDs and the same call graph over IDs, for bitmap-visited walks
+        self._class_names: List[str] = []
+        self._class_ids: Dict[str, int] = {}
+        self._call_ids: List[Tuple[int, ...]] = []
+        # Class name -> subpath from that class / classes it reaches, cleared by load_source
+        self._subpath_cache: Dict[str, ExecutionNode] = {}
+        self._reachable_from: Dict[str, FrozenSet[str]] = {}
+        # Lower-cased object name -> (class, method) pairs performing DML on it
+        self._dml_index: Dict[str, List[Tuple[str, str]]] = {}
         
     def load_source(self, source_path: Path):
         """
             Load all Apex classes and triggers from the source directory.
             
+            Files are parsed in a process pool once a project has more than
+            PARALLEL_PARSE_THRESHOLD class and trigger files. Files whose content
+            is unchanged since a previous run are loaded from the parse cache.
+            
             Args:
                 source_path: Path to the directory containing Apex files
                 
             Example:
                 >>> analyzer.load_source(Path('./force-app/main/default'))
         """
-        # Load classes
-        for class_file in source_path.rglob('*.cls'):
-            apex_class = self.parser.parse_file(class_file)
-            if apex_class:
-                self.classes[apex_class.name] = apex_class
+        # Previously built paths may reference classes that are about to change
+        self.execution_paths.clear()
+        self._subpath_cache.clear()
+        self._reachable_from.clear()
+        
+        # Collect class and trigger files in a single walk
+        class_files: List[Path] = []
+        trigger_files: List[Path] = []
+        for file_path in iter_files(source_path, ('.cls', '.trigger')):
+            if file_path.endswith('.cls'):
+                class_files.append(Path(file_path))
+            else:
+                trigger_files.append(Path(file_path))
                 
-        # Load triggers
-        for trigger_file in source_path.rglob('*.trigger'):
-            self._parse_trigger(trigger_file)
+        # Parse classes and triggers, reusing cached results for unchanged files,
+        # in worker processes for large projects
+        load_trigger = partial(_load_or_parse, parse=_parse_trigger_file, cache=self.cache)
+        if len(class_files) + len(trigger_files) > PARALLEL_PARSE_THRESHOLD:
+            load_class = partial(_load_or_parse, parse=_parse_class_file, cache=self.cache)
+            workers = os.cpu_count() or 1
+            chunksize = _pool_chunksize(len(class_files) + len(trigger_files), workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map submits eagerly, so triggers queue up behind the classes and
+                # the pool stays busy while class results are collected
+                class_results = executor.map(load_class, class_files, chunksize=chunksize)
+                trigger_results = executor.map(load_trigger, trigger_files, chunksize=chunksize)
+                parsed_classes = list(class_results)
+                parsed_triggers = list(trigger_results)
+        else:
+            load_class = partial(_load_or_parse, parse=self.parser.parse_source, cache=self.cache)
+            parsed_classes = [load_class(class_file) for class_file in class_files]
+            parsed_triggers = [load_trigger(trigger_file) for trigger_file in trigger_files]
+            
+        # Merge results on the main process
+        for apex_class in parsed_classes:
+            if apex_class:
+                # Interned keys make the many name lookups in path building cheaper
+                self.classes[sys.intern(apex_class.name)] = apex_class
+        for parsed_trigger in parsed_triggers:
+            if parsed_trigger:
+                name, trigger_data = parsed_trigger
+                self.triggers[name] = trigger_data
+            
+        self._build_call_graph()
+        self._build_dml_index()
+        self._resolve_trigger_references()
 
-    def _parse_trigger(self, trigger_file: Path):
+    def _build_call_graph(self):
         """
-            Parse a trigger file to extract its metadata.
+            Map each class to the de-duplicated known classes its methods call.
             
-            Args:
-                trigger_file: Path to the trigger file
-                
-            Note:
-                Extracts:
-                - Trigger name
-                - Object context
-                - Execution contexts
-                - Full content for analysis
+            Built once per load so path building does not refilter every class's
+            calls against the known classes on each visit. Callees are sorted so
+            paths do not depend on set iteration order.
+            
+            Classes are also numbered densely, with the graph mirrored over those
+            IDs, so walks that own their visited state can track it in a bytearray.
         """
-        try:
-            with open(trigger_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Extract trigger name and contexts
-            trigger_pattern = re.compile(
-                r'trigger\s+(?P<name>\w+)\s+on\s+(?P<object>\w+)\s*\('
-                r'(?P<contexts>[^)]+)\)',
-                re.MULTILINE
+        classes = self.classes
+        self._class_call_graph = {
+            name: tuple(sorted(call for call in apex_class.calls if call in classes))
+            for name, apex_class in classes.items()
+        }
+        self._class_names = list(self._class_call_graph)
+        self._class_ids = {name: class_id for class_id, name in enumerate(self._class_names)}
+        class_ids = self._class_ids
+        self._call_ids = [
+            tuple(class_ids[call] for call in calls)
+            for calls in self._class_call_graph.values()
+        ]
+
+    def _resolve_trigger_references(self):
+        """
+            Narrow each trigger's references down to the known classes it calls.
+            
+            Stored as 'class_references', in order of first reference, so path
+            building only iterates class hits rather than every identifier. The
+            filter and intern run through map/filter, keeping the per-identifier
+            loop in C.
+        """
+        is_class = self.classes.__contains__
+        intern = sys.intern
+        for trigger_data in self.triggers.values():
+            trigger_data['class_references'] = tuple(
+                map(intern, filter(is_class, trigger_data['references']))
             )
+
+    def _build_dml_index(self):
+        """
+            Index methods by the objects they perform DML on.
             
-            match = trigger_pattern.search(content)
-            if match:
-                trigger_dict = match.groupdict()
-                contexts = [ctx.strip() for ctx in trigger_dict['contexts'].split(',')]
-                
-                self.triggers[trigger_dict['name']] = {
-                    'object': trigger_dict['object'],
-                    'contexts': contexts,
-                    'content': content
-                }
-        except Exception as e:
-            print(f"Error parsing trigger {trigger_file}: {str(e)}")
+            Each method body is scanned once, so recursion analysis only has to
+            look up each trigger's object instead of rescanning every method.
+            Comments and string literals are masked first, as in the parser.
+            Only objects that have a trigger are indexed.
+        """
+        self._dml_index = {}
+        trigger_objects = {trigger_data['object'].lower() for trigger_data in self.triggers.values()}
+        for class_name, apex_class in self.classes.items():
+            for method in apex_class.methods:
+                targets = {target.lower() for target in _DML_TARGET_RE.findall(_mask_noncode(method.body))}
+                for target in targets & trigger_objects:
+                    self._dml_index.setdefault(target, []).append((class_name, method.name))
+
 
     def build_execution_path(self, trigger_context: TriggerContext) -> List[ExecutionNode]:
         """
@@ -167,38 +504,20 @@ class ApexAnalyzer:
             Example:
                 >>> context = TriggerContext('Account', 'before insert', 'AccountTrigger')
                 >>> path = analyzer.build_execution_path(context)
+                
+            Note:
+                Paths are cached in execution_paths until the next load_source;
+                a cached path is reused only if it starts at the same trigger.
+                Class subpaths may be shared between paths and must not be mutated.
         """
+        path_key = f"{trigger_context.object_name}_{trigger_context.context}"
+        cached = self.execution_paths.get(path_key)
+        if cached and cached[0].name == trigger_context.trigger_name:
+            return cached
+        
         path = []
         visited = set()
         
-        def build_path(component: str, comp_type: str, method: Optional[str] = None, 
-                      conditions: Optional[str] = None, order: int = 0):
-            """Recursively build execution path for a component."""
-            if component in visited:
-                return None  # Prevent infinite recursion
-                
-            visited.add(component)
-            node = ExecutionNode(
-                component_type=comp_type,
-                name=component,
-                method=method,
-                next_nodes=[],
-                conditions=conditions,
-                order=order
-            )
-            
-            # If it's a class, analyze its method calls
-            if comp_type == 'class' and component in self.classes:
-                apex_class = self.classes[component]
-                for apex_method in apex_class.methods:
-                    for call in apex_method.calls:
-                        # Check if the call is to another class we know about
-                        if call in self.classes:
-                            next_node = build_path(call, 'class', None, None, order + 1)
-                            if next_node:
-                                node.next_nodes.append(next_node)
-            
-            return node
         # Start with the trigger
         if trigger_context.trigger_name in self.triggers:
             trigger_data = self.triggers[trigger_context.trigger_name]
@@ -206,58 +525,228 @@ class ApexAnalyzer:
                 component_type='trigger',
                 name=trigger_context.trigger_name,
                 method=None,
-                next_nodes=[],
+                next_nodes=(),
                 conditions=None,
                 order=0
             )
             path.append(trigger_node)
             
-            # Analyze the trigger body for class calls
-            for class_name in self.classes:
-                if class_name in trigger_data['content']:
-                    class_node = build_path(class_name, 'class', None, None, 1)
-                    if class_node:
-                        trigger_node.next_nodes.append(class_node)
+            # Follow classes referenced by the trigger body, in order of first reference.
+            # A class's cached subpath is reused when none of the classes it reaches
+            # have been visited yet, since a fresh walk would then rebuild it exactly.
+            for class_name in trigger_data['class_references']:
+                if class_name in visited:
+                    continue
+                reachable = self._reachable(class_name)
+                if reachable.isdisjoint(visited):
+                    trigger_node.add_child(self._class_subpath(class_name))
+                    visited |= reachable
+                else:
+                    self._walk_class_calls(class_name, trigger_node, 1, visited)
         
-        self.execution_paths[f"{trigger_context.object_name}_{trigger_context.context}"] = path
+        self.execution_paths[path_key] = path
         return path
 
-    def analyze_recursion_risks(self) -> Dict[str, List[str]]:
-        """Identify potential recursion risks in the codebase."""
-        risks = {}
-        
-        for trigger_name, trigger_data in self.triggers.items():
-            object_name = trigger_data['object']
+    def iter_execution_path(self, trigger_context: TriggerContext) -> Iterator[ExecutionNode]:
+        """
+            Stream the execution path of a trigger context in depth-first order.
             
-            # Look for patterns that might cause recursion
-            for class_name, apex_class in self.classes.items():
-                for method in apex_class.methods:
-                    # Look for DML operations on the same object
-                    if (f"insert {object_name}" in method.body or
-                        f"update {object_name}" in method.body or
-                        f"delete {object_name}" in method.body):
-                        
-                        if trigger_name not in risks:
-                            risks[trigger_name] = []
-                        risks[trigger_name].append(
-                            f"Potential recursion in {class_name}.{method.name}: "
-                            f"DML operation on {object_name}"
-                        )
+            Yields the same nodes as a preorder walk of build_execution_path, but
+            without building the tree: each node's next_nodes is left empty and
+            its depth is given by order. Nothing is cached, so memory use is
+            bounded by the walk's stack and visited set.
+            
+            Args:
+                trigger_context: Context to stream the path for
+                
+            Yields:
+                ExecutionNode: Trigger node followed by each class it reaches
+                
+            Example:
+                >>> for node in analyzer.iter_execution_path(context):
+                ...     print('  ' * node.order + node.name)
+        """
+        trigger_data = self.triggers.get(trigger_context.trigger_name)
+        if trigger_data is None:
+            return
+        yield ExecutionNode(
+            component_type='trigger',
+            name=trigger_context.trigger_name,
+            method=None,
+            next_nodes=(),
+            conditions=None,
+            order=0
+        )
         
-        return risks
+        # Visited classes are tracked in a bitmap indexed by class ID
+        call_ids = self._call_ids
+        names = self._class_names
+        visited = bytearray(len(call_ids))
+        for class_name in trigger_data['class_references']:
+            stack = [(self._class_ids[class_name], 1)]
+            while stack:
+                class_id, order = stack.pop()
+                if visited[class_id]:
+                    continue
+                visited[class_id] = 1
+                yield ExecutionNode(
+                    component_type='class',
+                    name=names[class_id],
+                    method=None,
+                    next_nodes=(),
+                    conditions=None,
+                    order=order
+                )
+                stack.extend((call, order + 1) for call in reversed(call_ids[class_id]))
 
-    def get_entry_points(self) -> Dict[str, List[str]]:
-        """Identify all automation entry points for each object."""
+    def build_execution_graph(self, trigger_context: TriggerContext) -> ExecutionGraph:
+        """
+            Build the execution path of a trigger context as a compact ExecutionGraph.
+            
+            Args:
+                trigger_context: Context to build the path for
+                
+            Returns:
+                ExecutionGraph: Column-oriented copy of the execution path
+                
+            Example:
+                >>> graph = analyzer.build_execution_graph(context)
+                >>> root = graph.view(graph.roots[0])
+        """
+        return ExecutionGraph.from_path(self.build_execution_path(trigger_context))
+
+    def _walk_class_calls(self, start_class: str, parent: Optional[ExecutionNode],
+                          order: int, visited: Set[str]) -> ExecutionNode:
+        """
+            Depth-first walk of the class call graph from a single class.
+            
+            Uses an explicit stack of (class name, parent node, order) entries,
+            pushed in reverse so callees are visited in call-graph order.
+            
+            Args:
+                start_class: Class to start the walk from; must not be in visited
+                parent: Node the start class's node is added to, if any
+                order: Execution order of the start class
+                visited: Classes already on the path; updated in place
+                
+            Returns:
+                ExecutionNode: Node of the start class
+        """
+        # Hot lookups are bound to locals for the duration of the walk.
+        call_graph = self._class_call_graph
+        new_node = ExecutionNode
+        mark_visited = visited.add
+        stack = [(start_class, parent, order)]
+        pop = stack.pop
+        push = stack.extend
+        root = None
+        while stack:
+            component, parent, order = pop()
+            if component in visited:
+                continue  # Prevent infinite recursion
+            mark_visited(component)
+            node = new_node('class', component, None, (), None, order)
+            if root is None:
+                root = node
+            if parent is not None:
+                parent.add_child(node)
+            # Follow calls to other classes we know about; leaves push nothing
+            calls = call_graph[component]
+            if calls:
+                child_order = order + 1
+                push([(call, node, child_order) for call in reversed(calls)])
+        return root
+
+    def _reachable(self, class_name: str) -> FrozenSet[str]:
+        """
+            Get every known class reachable from a class through the call graph.
+            
+            This is exactly the set of classes a walk from the class with an empty
+            visited set would add, computed without allocating any nodes and
+            cached until the next load_source.
+            
+            Args:
+                class_name: Known class to start from
+                
+            Returns:
+                FrozenSet[str]: The class itself and every class it reaches
+        """
+        reachable = self._reachable_from.get(class_name)
+        if reachable is None:
+            call_ids = self._call_ids
+            start = self._class_ids[class_name]
+            seen = bytearray(len(call_ids))
+            seen[start] = 1
+            found = [start]
+            stack = [start]
+            while stack:
+                for call in call_ids[stack.pop()]:
+                    if not seen[call]:
+                        seen[call] = 1
+                        found.append(call)
+                        stack.append(call)
+            names = self._class_names
+            reachable = self._reachable_from[class_name] = frozenset([names[i] for i in found])
+        return reachable
+
+    def _class_subpath(self, class_name: str) -> ExecutionNode:
+        """
+            Get the execution subpath of a class called directly by a trigger.
+            
+            The subpath is built once per load_source with an empty visited set and
+            shared between the paths that reuse it, so callers must not mutate it.
+            It covers exactly the classes in _reachable(class_name).
+            
+            Args:
+                class_name: Known class to build the subpath for
+                
+            Returns:
+                ExecutionNode: Subpath root
+        """
+        subpath = self._subpath_cache.get(class_name)
+        if subpath is None:
+            subpath = self._subpath_cache[class_name] = self._walk_class_calls(
+                class_name, None, 1, set()
+            )
+        return subpath
+
+    def analyze(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+            Identify recursion risks and automation entry points in one pass.
+            
+            Each trigger is visited once and contributes to both results.
+            
+            Returns:
+                Tuple[Dict[str, List[str]], Dict[str, List[str]]]: Recursion risks
+                by trigger, and entry points by object
+                
+            Example:
+                >>> risks, entry_points = analyzer.analyze()
+        """
+        risks = {}
         entry_points = {}
+        dml_index = self._dml_index
         
-        # Analyze triggers
         for trigger_name, trigger_data in self.triggers.items():
             object_name = trigger_data['object']
-            if object_name not in entry_points:
-                entry_points[object_name] = []
             
-            entry_points[object_name].append(
-                f"Trigger: {trigger_name} ({', '.join(trigger_data['contexts'])})"
+            entry_points.setdefault(object_name, []).append(
+                f"Trigger: {trigger_name} ({context_str(trigger_data['contexts'])})"
             )
+            
+            # Look up methods performing DML on the trigger's own object
+            for class_name, method_name in dml_index.get(object_name.lower(), []):
+                risks.setdefault(trigger_name, []).append(
+                    f"Potential recursion in {class_name}.{method_name}: "
+                    f"DML operation on {object_name}"
+                )
         
-        return entry_points
\ No newline at end of file
+        return risks, entry_points
+
+    def analyze_recursion_risks(self) -> Dict[str, List[str]]:
+        """Identify potential recursion risks in the codebase."""
+        return self.analyze()[0]
+
+    def get_entry_points(self) -> Dict[str, List[str]]:
+        """Identify all automation entry points for each object."""
+        return self.analyze()[1]
\ No newline at end of file
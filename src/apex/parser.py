@@ -12,12 +12,168 @@
     - Documentation comments
 """
 
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Set, Union
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Optional, Union
 from pathlib import Path
+from ..utils.parse_cache import ParseCache
+import hashlib
+import os
 import re
+import sys
+import time
 from enum import Enum
 
+# Bump when parsing rules or the parsed classes change, so cached results are discarded
+PARSER_VERSION = '15'
+# Minimum number of files before parse_files spreads parsing across processes
+PARALLEL_PARSE_THRESHOLD = 64
+# Files modified more recently than this are always read and hashed
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+_NEWLINE_RE = re.compile('\n')
+
+def _newline_offsets(text: str) -> List[int]:
+    """
+        Find the offset of every newline in a string, in ascending order.
+        
+        The number of newlines before position ``pos`` is then
+        ``bisect_left(offsets, pos)``, an O(log N) replacement for
+        ``text[:pos].count('\\n')``.
+        
+        Args:
+            text: String to index
+            
+        Returns:
+            List[int]: Offsets of each '\\n' character
+    """
+    # A list rather than an array: bisect on an array boxes every probed item
+    return [match.start() for match in _NEWLINE_RE.finditer(text)]
+
+# Keywords followed by '(' that are not method calls
+_CONTROL_KEYWORDS = frozenset({'if', 'while', 'for', 'switch', 'catch', 'return', 'throw', 'do'})
+
+# Generic collection types recognised in parameter declarations
+_COLLECTION_PREFIXES = ('List<', 'Set<', 'Map<')
+
+# Collection syntax in a DML target, marking a bulk operation
+_BULK_TYPE_RE = re.compile(r'\[\]|\<.+\>')
+
+# Bytes requested per read when loading a source file
+_READ_CHUNK_SIZE = 1 << 16
+
+def _read_source(path: Union[str, Path]) -> bytes:
+    """
+        Read a whole file with raw os calls.
+        
+        Apex sources are small and numerous, so the buffered file object that
+        open() sets up (with its own fstat and isatty checks) costs more than
+        the read itself; plain os.open/os.read is over twice as fast per file.
+        
+        Args:
+            path: File to read
+            
+        Returns:
+            bytes: File content
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b''.join(chunks)
+
+def _decode_source(raw: bytes) -> str:
+    """
+        Decode UTF-8 source, translating newlines as text-mode open() would.
+        
+        Args:
+            raw: File content
+            
+        Returns:
+            str: Decoded content with '\\r\\n' and '\\r' line endings as '\\n'
+    """
+    content = raw.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+# Comments and string literals, which body scans must not match inside
+_NONCODE_RE = re.compile(r"//[^\n]*+|/\*.*?\*/|'(?:[^'\\\n]|\\.)*+'", re.DOTALL)
+_NOT_NEWLINE_RE = re.compile(r'[^\n]+')
+
+def _blank_noncode(match: re.Match) -> str:
+    """Replacement for _NONCODE_RE: spaces of the same length, keeping newlines and quotes."""
+    token = match.group()
+    if token[0] == "'":
+        return "'" + ' ' * (len(token) - 2) + "'"
+    if '\n' in token:
+        return _NOT_NEWLINE_RE.sub(lambda run: ' ' * len(run.group()), token)
+    return ' ' * len(token)
+
+def _mask_noncode(text: str) -> str:
+    """
+        Blank out comments and string literal contents.
+        
+        Offsets and newlines are preserved, so positions and line numbers found
+        in the masked text hold for the original.
+        
+        Args:
+            text: Source text
+            
+        Returns:
+            str: Text of the same length with comments and string contents as spaces
+    """
+    # Every comment and string literal starts with '/' or a quote
+    if '/' not in text and "'" not in text:
+        return text
+    return _NONCODE_RE.sub(_blank_noncode, text)
+
+# Everything up to and including the next brace. Comments and string literals
+# are consumed whole so braces inside them are ignored; a '/' or quote that
+# starts neither is consumed alone. The skipping happens inside the regex
+# engine, so the Python loop in _find_block_end runs once per brace
+_NEXT_BRACE_RE = re.compile(
+    r"(?://[^\n]*+|/\*.*?\*/|'(?:[^'\\\n]|\\.)*+'|[^{}/']++|['/])*+([{}])",
+    re.DOTALL
+)
+
+def _find_block_end(text: str, open_brace: int) -> int:
+    """
+        Find the brace closing the block opened at a given position.
+        
+        Scans forward once, tracking nesting depth and skipping comments and
+        string literals, so blocks may nest to any depth.
+        
+        Args:
+            text: Source text
+            open_brace: Offset of the opening '{'
+            
+        Returns:
+            int: Offset of the matching '}', -1 if the block is never closed
+    """
+    next_brace = _NEXT_BRACE_RE.match
+    depth = 0
+    pos = open_brace
+    while True:
+        token = next_brace(text, pos)
+        if token is None:
+            return -1
+        pos = token.end()
+        if token.group(1) == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return pos - 1
+
 class ApexModifier(Enum):
     """
         Salesforce Apex access and behavior modifiers.
@@ -57,7 +213,15 @@ class ApexModifier(Enum):
     WITHOUT_SHARING = 'without sharing'
     INHERITED_SHARING = 'inherited sharing'
 
-@dataclass
+# Modifier keyword -> ApexModifier, avoiding the enum's call machinery per token
+_MOD_LOOKUP = {modifier.value: modifier for modifier in ApexModifier}
+# Sharing modifiers by their leading keyword ('with', 'without', 'inherited')
+_SHARING_LOOKUP = {
+    modifier.value.split()[0]: modifier
+    for modifier in ApexModifier if modifier.value.endswith(' sharing')
+}
+
+@dataclass(slots=True)
 class ApexAnnotation:
     """
         Represents a Salesforce Apex annotation.
@@ -78,7 +242,7 @@ class ApexAnnotation:
     name: str
     parameters: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class ApexParameter:
     """
         Represents a parameter in an Apex method.
@@ -105,7 +269,7 @@ class ApexParameter:
     is_collection: bool
     collection_type: Optional[str] = None  # List, Set, Map, etc.
 
-@dataclass
+@dataclass(slots=True)
 class DMLOperation:
     """
         Represents a database operation in Apex code.
@@ -132,7 +296,7 @@ class DMLOperation:
     is_bulk: bool
     line_number: int
 
-@dataclass
+@dataclass(slots=True)
 class SOQLQuery:
     """
         Represents a SOQL query in Apex code.
@@ -156,7 +320,7 @@ class SOQLQuery:
     referenced_objects: List[str]
     line_number: int
 
-@dataclass
+@dataclass(slots=True)
 class ApexMethod:
     """
         Represents a method in an Apex class.
@@ -171,7 +335,7 @@ class ApexMethod:
             modifiers: Access and behavior modifiers
             annotations: Method annotations
             body: Method implementation
-            calls: Set of methods called
+            calls: Names of the methods called, interned
             dml_operations: Database operations performed
             soql_queries: SOQL queries executed
             line_number: Source code location
@@ -185,7 +349,7 @@ class ApexMethod:
             ...     modifiers=[ApexModifier.PUBLIC],
             ...     annotations=[],
             ...     body="// implementation",
-            ...     calls={'save', 'validate'},
+            ...     calls=frozenset({'save', 'validate'}),
             ...     dml_operations=[...],
             ...     soql_queries=[...],
             ...     line_number=45,
@@ -199,13 +363,13 @@ class ApexMethod:
     modifiers: List[ApexModifier]
     annotations: List[ApexAnnotation]
     body: str
-    calls: Set[str]
+    calls: FrozenSet[str]
     dml_operations: List[DMLOperation]
     soql_queries: List[SOQLQuery]
     line_number: int
     doc_comment: Optional[str]
 
-@dataclass
+@dataclass(slots=True)
 class ApexProperty:
     """
         Represents a property in an Apex class.
@@ -238,7 +402,7 @@ class ApexProperty:
     setter: Optional[str]
     line_number: int
 
-@dataclass
+@dataclass(slots=True)
 class ApexClass:
     """
         Represents a complete Apex class.
@@ -257,6 +421,7 @@ class ApexClass:
             interfaces: Implemented interfaces
             inner_classes: Nested class definitions
             doc_comment: Class documentation
+            calls: Union of the calls made by all methods
             
         Example:
             >>> apex_class = ApexClass(
@@ -283,60 +448,141 @@ class ApexClass:
     interfaces: List[str]
     inner_classes: List['ApexClass']
     doc_comment: Optional[str]
+    calls: FrozenSet[str] = frozenset()
+
+# Parser of a worker process, set by _init_worker or created on first use
+_worker_parser: Optional['ApexParser'] = None
+
+def _init_worker(cache_dir: Optional[Path], parse_bodies: bool):
+    """Create the parser used by a parse_files worker process."""
+    global _worker_parser
+    _worker_parser = ApexParser(cache_dir, parse_bodies)
+
+def _get_worker_parser() -> 'ApexParser':
+    """Return the process-wide worker parser, creating a default one if needed."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ApexParser()
+    return _worker_parser
+
+def _parse_in_worker(file_path: Path) -> Optional['ApexClass']:
+    """Parse one file with the worker process's parser."""
+    return _get_worker_parser().parse_file(file_path)
+
+def _pool_chunksize(count: int, workers: int) -> int:
+    """Chunk size for mapping count items over a pool of workers."""
+    # About four chunks per worker keeps IPC low while still balancing load
+    return max(1, count // (workers * 4))
 
 class ApexParser:
     """
         Enhanced parser for Apex code that extracts detailed class structure and dependencies.
+        
+        Attributes:
+            cache: On-disk cache of parsed files, None when caching is disabled
+            parse_bodies: Whether method bodies are scanned for calls, DML and SOQL
+            MAX_CONTENT_CACHE_ENTRIES: Capacity of the in-memory cache of parsed class content
+            
+        Example:
+            >>> parser = ApexParser(cache_dir=Path('.apex_cache'))
+            >>> apex_class = parser.parse_file(Path('classes/AccountService.cls'))
+            >>> # Signatures only: skips the per-method body scans
+            >>> outline = ApexParser(parse_bodies=False).parse_file(path)
     """
     
-    def __init__(self):
+    MAX_CONTENT_CACHE_ENTRIES = 128
+    
+    def __init__(self, cache_dir: Optional[Path] = None, parse_bodies: bool = True):
         """
             Initialize parser with regex patterns.
+            
+            Args:
+                cache_dir: Directory for cached parse results, None to disable caching
+                parse_bodies: Scan method bodies for calls, DML operations and SOQL
+                    queries; when False those fields are left empty (ApexClass.calls
+                    included), which is much cheaper for callers that only need
+                    class and method signatures
         """
+        self.parse_bodies = parse_bodies
+        # Signature-only results are cached separately from full ones
+        cache_version = PARSER_VERSION if parse_bodies else f"{PARSER_VERSION}-signatures"
+        self.cache = ParseCache(cache_dir, cache_version) if cache_dir is not None else None
+        # Content digest -> parsed class, least recently used first
+        self._content_cache: 'OrderedDict[bytes, Optional[ApexClass]]' = OrderedDict()
         self._init_patterns()
 
-    def _init_patterns(self):
+    @classmethod
+    def _init_patterns(cls):
         """
-            Initialize all regex patterns used for parsing.
+            Compile all regex patterns used for parsing, once per class.
+            
+            The compiled patterns are stored as class attributes and shared by every
+            instance, so creating a parser per file costs no recompilation.
+            
+            Method, class and inner class patterns match declaration headers up to
+            the opening '{', as do property and accessor patterns; their bodies are
+            delimited with _find_block_end so nested blocks are handled at any depth.
+            
+            None of the patterns use ^ or $, so none are compiled with MULTILINE.
         """
+        if '_patterns_ready' in cls.__dict__:
+            return
         # Annotation pattern with parameter support
-        self.annotation_pattern = re.compile(
-            r'@(?P<name>\w+)(?:\((?P<params>.*?)\))?',
-            re.MULTILINE
+        cls.annotation_pattern = re.compile(
+            r"@(?P<name>\w+)(?:\((?P<params>(?:[^()']++|'(?:[^'\\\n]|\\.)*+')*+)\))?"
+        )
+        # One named annotation parameter. Apex separates them with spaces, but
+        # commas are accepted too; quoted values may contain either
+        cls.annotation_param_pattern = re.compile(
+            r'(\w+)\s*=\s*(?:\'((?:[^\'\\]|\\.)*)\'|"([^"]*)"|([^,\s]*))'
+        )
+        # Leading annotations. Their parameter lists cannot contain unquoted
+        # parentheses, so a list never extends past its own ')' and a failed match
+        # costs linear time instead of retrying every later ')' in the file.
+        # Method and class headers start at a token boundary (the lookbehind). Like
+        # the property pattern's, their modifier runs are possessive: no modifier
+        # keyword can also be the type, name or 'class' keyword that follows, so
+        # giving one back never helps
+        annotations_prefix = (
+            r"(?P<annotations>(?:@\w+(?:\((?:[^()']++|'(?:[^'\\\n]|\\.)*+')*+\))?\s+)*)"
         )
         # Enhanced method pattern with annotations and modifiers
-        self.method_pattern = re.compile(
-            r'(?P<annotations>(?:@\w+(?:\(.*?\))?\s+)*)'
-            r'(?P<modifiers>(?:(?:private|public|global|protected|static|virtual|abstract|override|testmethod)\s+)*)'
+        cls.method_pattern = re.compile(
+            r'(?<![\w.<>])' + annotations_prefix +
+            r'(?P<modifiers>(?:(?:private|public|global|protected|static|virtual|abstract|override|testmethod)\s+)*+)'
             r'(?P<return_type>[\w\.<>]+(?:\[\])?)\s+'
             r'(?P<name>\w+)\s*'
-            r'\((?P<params>.*?)\)'
-            r'(?:\s+(?P<throws>throws\s+[\w\s,]+))?\s*'
-            r'{(?P<body>(?:[^{}]|{[^{}]*})*)}',
-            re.MULTILINE | re.DOTALL
+            r'\((?P<params>[^()]*+)\)'
+            r'(?:\s+(?P<throws>throws\s+[\w\s,]+))?\s*{',
+            re.DOTALL
         )
-        # Property pattern
-        self.property_pattern = re.compile(
-            r'(?P<modifiers>(?:(?:private|public|global|protected|static)\s+)*)'
+        # Property header pattern. Declarations start at a token boundary, so the
+        # lookbehind stops the engine retrying from every character inside identifiers
+        cls.property_pattern = re.compile(
+            r'(?<![\w.<>])'
+            r'(?P<modifiers>(?:(?:private|public|global|protected|static)\s+)*+)'
             r'(?P<type>[\w\.<>]+(?:\[\])?)\s+'
             r'(?P<name>\w+)\s*{'
-            r'(?P<accessors>(?:[^{}]|{[^{}]*})*)}',
-            re.MULTILINE | re.DOTALL
+        )
+        # A property block opens with an accessor, which tells it apart from
+        # class and enum bodies that share the header shape
+        cls.accessor_start_pattern = re.compile(
+            r'\s*(?:(?:private|public|global|protected)\s+)?(?:get|set)\b'
         )
         # Class pattern
-        self.class_pattern = re.compile(
-            r'(?P<annotations>(?:@\w+(?:\(.*?\))?\s+)*)'
-            r'(?P<modifiers>(?:(?:private|public|global|virtual|abstract)\s+)*)'
-            r'(?P<sharing>(?:with|without|inherited)\s+sharing\s+)?'
+        cls.class_pattern = re.compile(
+            r'(?<![\w.<>])' + annotations_prefix +
+            r'(?P<modifiers>(?:(?:private|public|global|virtual|abstract|'
+            r'(?:with|without|inherited)\s+sharing)\s+)*+)'
             r'class\s+'
             r'(?P<name>\w+)'
             r'(?:\s+extends\s+(?P<superclass>\w+))?'
             r'(?:\s+implements\s+(?P<interfaces>[\w\s,]+))?'
-            r'\s*{(?P<body>(?:[^{}]|{[^{}]*})*)}',
-            re.MULTILINE | re.DOTALL
+            r'\s*{',
+            re.DOTALL
         )
         # SOQL pattern
-        self.soql_pattern = re.compile(
+        cls.soql_pattern = re.compile(
             r'\[(?P<query>'
             r'SELECT\s+[\w\s,\.*()]+\s+'
             r'FROM\s+(?P<object>\w+)'
@@ -344,27 +590,64 @@ class ApexParser:
             r'(?:\s+ORDER\s+BY\s+[^]\n]+)?'
             r'(?:\s+LIMIT\s+\d+)?'
             r')\]',
-            re.IGNORECASE | re.MULTILINE
+            re.IGNORECASE
         )
         # DML pattern
-        self.dml_pattern = re.compile(
+        cls.dml_pattern = re.compile(
             r'(?P<operation>insert|update|delete|upsert|merge)\s+'
-            r'(?P<object>[\w\s,]+?);',
-            re.MULTILINE
+            r'(?P<object>[\w\s,]+?);'
         )
+        # Method call pattern: the called name, up to its opening parenthesis. The
+        # name is taken possessively, so a word not followed by '(' fails at once
+        # instead of being retried one character shorter at a time
+        cls.call_pattern = re.compile(r'\b(?<!new\s)(\w++)\s*+\(')
+        # Property accessor bodies
+        cls.getter_pattern = re.compile(r'\bget\s*{')
+        cls.setter_pattern = re.compile(r'\bset\s*{')
+        # Objects a SOQL query selects from or joins
+        cls.from_join_pattern = re.compile(r'(?:FROM|JOIN)\s+(\w+)', re.IGNORECASE)
         # Doc comment pattern
-        self.doc_comment_pattern = re.compile(
+        cls.doc_comment_pattern = re.compile(
             r'/\*\*(?P<comment>.*?)\*/',
-            re.MULTILINE | re.DOTALL
+            re.DOTALL
         )
         # Inner class pattern
-        self.inner_class_pattern = re.compile(
+        cls.inner_class_pattern = re.compile(
             r'(?P<access>private|public|global)\s+'
             r'class\s+'
             r'(?P<name>\w+)'
-            r'\s*{(?P<body>(?:[^{}]|{[^{}]*})*)}',
-            re.MULTILINE | re.DOTALL
+            r'\s*{',
+            re.DOTALL
         )
+        cls._patterns_ready = True
+
+    def _iter_blocks(self, pattern: re.Pattern, text: str, pos: int = 0):
+        """
+            Find successive declarations whose header pattern ends at an opening brace.
+            
+            Searching resumes after each block's closing brace, so declarations
+            nested inside a matched block are not reported separately.
+            
+            Args:
+                pattern: Header pattern ending with '{'
+                text: Text to search
+                pos: Offset to start searching from
+                
+            Yields:
+                Tuple[re.Match, str, int]: Header match, block body, and offset
+                just past the closing brace
+        """
+        while True:
+            match = pattern.search(text, pos)
+            if not match:
+                return
+            close_brace = _find_block_end(text, match.end() - 1)
+            if close_brace == -1:
+                # Unbalanced block: skip this header and keep looking
+                pos = match.end()
+                continue
+            yield match, text[match.end():close_brace], close_brace + 1
+            pos = close_brace + 1
 
     def _parse_annotations(self, annotations_str: str) -> List[ApexAnnotation]:
         """
@@ -379,15 +662,13 @@ class ApexParser:
                 param_str = match.group('params')
                 if '=' in param_str:
                     # Named parameters
-                    param_pairs = param_str.split(',')
-                    for pair in param_pairs:
-                        key, value = pair.split('=')
-                        params[key.strip()] = value.strip().strip('"\'')
+                    for key, single, double, bare in self.annotation_param_pattern.findall(param_str):
+                        params[key] = single or double or bare
                 else:
                     # Single unnamed parameter
                     params['value'] = param_str.strip().strip('"\'')
             annotations.append(ApexAnnotation(
-                name=match.group('name'),
+                name=sys.intern(match.group('name')),
                 parameters=params
             ))
         return annotations
@@ -395,24 +676,34 @@ class ApexParser:
     def _parse_parameters(self, params_str: str) -> List[ApexParameter]:
         """
             Parse method parameters with enhanced type support.
+            
+            Type names are interned: a handful of types (String, Id, List...)
+            account for most parameters across a project.
         """
         parameters = []
         if not params_str.strip():
             return parameters
         for param in params_str.split(','):
-            param = param.strip()
-            if param:
+            # Only the last whitespace run separates the type from the name
+            param_parts = param.rsplit(None, 1)
+            if param_parts:
                 is_collection = False
                 collection_type = None
-                param_parts = param.split()
-                type_str = ' '.join(param_parts[:-1])
                 name = param_parts[-1]
-                # Handle collection types
-                collection_match = re.match(r'(List|Set|Map)<(.+)>', type_str)
-                if collection_match:
+                type_str = param_parts[0].lstrip() if len(param_parts) == 2 else ''
+                # Collapse tabs, newlines and repeated spaces inside the type
+                if '  ' in type_str or not type_str.isprintable():
+                    type_str = ' '.join(type_str.split())
+                # Handle collection types: the element type runs to the last '>'.
+                # The prefix test comes first so plain types skip both searches
+                open_angle = close_angle = -1
+                if type_str.startswith(_COLLECTION_PREFIXES):
+                    open_angle = type_str.find('<')
+                    close_angle = type_str.rfind('>')
+                if close_angle > open_angle + 1:
                     is_collection = True
-                    collection_type = collection_match.group(1)
-                    type_str = collection_match.group(2)
+                    collection_type = type_str[:open_angle]
+                    type_str = type_str[open_angle + 1:close_angle]
                 elif type_str.endswith('[]'):
                     is_collection = True
                     collection_type = 'Array'
@@ -420,98 +711,188 @@ class ApexParser:
                 
                 parameters.append(ApexParameter(
                     name=name,
-                    type=type_str,
+                    type=sys.intern(type_str),
                     is_collection=is_collection,
-                    collection_type=collection_type
+                    collection_type=collection_type and sys.intern(collection_type)
                 ))
         return parameters
 
-    def _parse_method_body(self, body: str, line_offset: int) -> tuple[Set[str], List[DMLOperation], List[SOQLQuery]]:
+    def _parse_method_body(self, body: str, body_start: int,
+                           newlines: List[int]) -> tuple[FrozenSet[str], List[DMLOperation], List[SOQLQuery]]:
         """
             Parse method body for calls, DML operations, and SOQL queries.
+            
+            Line numbers come from the enclosing text's newline index, in which
+            the body starts at body_start, so no index is built per body.
+            Scans run over a copy of the body with comments and string literals
+            blanked, so text such as '// update later' is not taken for code.
+            Query text is still taken from the original body. Call, operation
+            and object names are interned, so the same name seen across many
+            methods is stored once.
         """
-        calls = set()
+        intern = sys.intern
+        code = _mask_noncode(body)
         dml_operations = []
         soql_queries = []
-        # Extract method calls
-        call_pattern = re.compile(r'(?<!new\s)\b\w+\s*\([^)]*\)')
-        for match in call_pattern.finditer(body):
-            call = match.group()
-            method_name = call[:call.index('(')].strip()
-            if method_name not in ('if', 'while', 'for', 'switch'):
-                calls.add(method_name)
+        # Extract method calls, including calls nested in another call's arguments
+        calls = frozenset(map(intern, set(self.call_pattern.findall(code)) - _CONTROL_KEYWORDS))
         # Extract DML operations
-        for match in self.dml_pattern.finditer(body):
-            line_number = line_offset + body[:match.start()].count('\n')
+        for match in self.dml_pattern.finditer(code):
+            line_number = bisect_left(newlines, body_start + match.start()) + 1
+            operation, target = match.group('operation', 'object')
             dml_operations.append(DMLOperation(
-                operation=match.group('operation'),
-                object_type=match.group('object').strip(),
-                is_bulk=bool(re.search(r'\[\]|\<.+\>', match.group('object'))),
+                operation=intern(operation),
+                object_type=intern(target.strip()),
+                is_bulk=_BULK_TYPE_RE.search(target) is not None,
                 line_number=line_number
             ))
-        # Extract SOQL queries
-        for match in self.soql_pattern.finditer(body):
-            line_number = line_offset + body[:match.start()].count('\n')
-            query = match.group('query')
-            referenced_objects = [match.group('object')]
-            # Extract related objects
-            for relationship in re.finditer(r'FROM\s+(\w+)|JOIN\s+(\w+)', query, re.IGNORECASE):
-                obj = relationship.group(1) or relationship.group(2)
-                if obj not in referenced_objects:
-                    referenced_objects.append(obj)
+        # Extract SOQL queries; inline queries are bracketed, so bodies without '[' are skipped
+        if '[' not in code:
+            return calls, dml_operations, soql_queries
+        for match in self.soql_pattern.finditer(code):
+            line_number = bisect_left(newlines, body_start + match.start()) + 1
+            query = body[match.start('query'):match.end('query')]
+            # Extract related objects, de-duplicated in order of first reference
+            referenced_objects = dict.fromkeys([intern(match.group('object'))])
+            referenced_objects.update(dict.fromkeys(map(intern, self.from_join_pattern.findall(match.group('query')))))
             soql_queries.append(SOQLQuery(
                 query=query,
-                referenced_objects=referenced_objects,
+                referenced_objects=list(referenced_objects),
                 line_number=line_number
             ))
         return calls, dml_operations, soql_queries
 
-    def _parse_property(self, property_match: re.Match) -> ApexProperty:
+    def _parse_property(self, property_match: re.Match, accessors: str) -> ApexProperty:
         """
             Parse an Apex property definition.
         """
-        property_dict = property_match.groupdict()
-        modifiers = [ApexModifier(mod.strip()) 
-                    for mod in property_dict['modifiers'].split()
-                    if mod.strip()]
-        accessors = property_dict['accessors']
+        modifiers = [_MOD_LOOKUP[mod] for mod in property_match['modifiers'].split()]
         getter = setter = None
-        # Extract getter and setter if present
-        getter_match = re.search(r'get\s*{([^}]+)}', accessors)
-        if getter_match:
-            getter = getter_match.group(1).strip()
-        setter_match = re.search(r'set\s*{([^}]+)}', accessors)
-        if setter_match:
-            setter = setter_match.group(1).strip()
+        # Extract getter and setter bodies; automatic properties ('get; set;') have none
+        if '{' in accessors:
+            getter = self._accessor_body(self.getter_pattern, accessors)
+            setter = self._accessor_body(self.setter_pattern, accessors)
         return ApexProperty(
-            name=property_dict['name'],
-            type=property_dict['type'],
+            name=property_match['name'],
+            type=sys.intern(property_match['type']),
             modifiers=modifiers,
             getter=getter,
             setter=setter,
             line_number=0  # Would need to calculate actual line number
         )
 
+    def _accessor_body(self, pattern: re.Pattern, accessors: str) -> Optional[str]:
+        """
+            Extract the body of the get or set accessor whose header pattern matches.
+        """
+        match = pattern.search(accessors)
+        if not match:
+            return None
+        close_brace = _find_block_end(accessors, match.end() - 1)
+        if close_brace == -1:
+            return None
+        return accessors[match.end():close_brace].strip()
+
     def _parse_inner_classes(self, class_body: str) -> List[ApexClass]:
         """
             Parse inner class definitions.
         """
         inner_classes = []
-        for match in self.inner_class_pattern.finditer(class_body):
-            inner_dict = match.groupdict()
-            inner_class = self._parse_class_content(inner_dict['body'], Path(""))
+        # Most classes have no inner classes; skip the scan when the keyword is absent
+        if 'class' not in class_body:
+            return inner_classes
+        for _, body, _ in self._iter_blocks(self.inner_class_pattern, class_body):
+            inner_class = self._parse_class_content(body, Path(""))
             if inner_class:
                 inner_classes.append(inner_class)
         return inner_classes
 
+    def parse_files(self, paths: Iterable[Path],
+                    workers: Optional[int] = None) -> Dict[Path, Optional[ApexClass]]:
+        """
+            Parse several Apex class files, in worker processes for large batches.
+            
+            Batches of up to PARALLEL_PARSE_THRESHOLD files are parsed in-process,
+            since starting workers would cost more than it saves. Each worker
+            builds its own parser with this parser's cache directory and settings.
+            
+            Args:
+                paths: Class files to parse
+                workers: Number of worker processes (default: one per CPU)
+                
+            Returns:
+                Dict[Path, Optional[ApexClass]]: Parsed class per path, None where
+                parsing failed
+                
+            Example:
+                >>> classes = parser.parse_files(Path('classes').glob('*.cls'))
+        """
+        paths = list(paths)
+        if len(paths) <= PARALLEL_PARSE_THRESHOLD:
+            return {path: self.parse_file(path) for path in paths}
+        cache_dir = self.cache.cache_dir if self.cache is not None else None
+        workers = workers or os.cpu_count() or 1
+        chunksize = _pool_chunksize(len(paths), workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(cache_dir, self.parse_bodies)) as executor:
+            return dict(zip(paths, executor.map(_parse_in_worker, paths, chunksize=chunksize)))
+
     def parse_file(self, file_path: Path) -> Optional[ApexClass]:
         """
             Parse an Apex class file and return its structure.
+            
+            The file is read as bytes with _read_source. With a cache configured,
+            results are keyed by the file's path and raw content plus
+            PARSER_VERSION, so unchanged files are neither decoded nor reparsed.
+            The content key is also recorded under the file's modification time
+            and size; while those are unchanged, the file is not even read or
+            hashed.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return self._parse_class_content(content, file_path)
+            stat_key = None
+            if self.cache is not None:
+                stat = os.stat(file_path)
+                stat_key = self.cache.key(
+                    b'stat', os.fsencode(file_path), b'%d:%d' % (stat.st_mtime_ns, stat.st_size)
+                )
+                content_key = self.cache.get(stat_key)
+                if content_key is not None:
+                    apex_class = self.cache.get(content_key)
+                    if apex_class is not None:
+                        return apex_class
+                # Files modified within the last couple of seconds may change again
+                # without their mtime moving, so only settled files get a stat entry
+                if time.time_ns() - stat.st_mtime_ns < RACY_MTIME_WINDOW_NS:
+                    stat_key = None
+            raw = _read_source(file_path)
+            key = None
+            if self.cache is not None:
+                key = self.cache.key(os.fsencode(file_path), raw)
+                apex_class = self.cache.get(key)
+                if apex_class is not None:
+                    if stat_key is not None:
+                        self.cache.put(stat_key, key)
+                    return apex_class
+            apex_class = self._parse_class_content(_decode_source(raw), file_path)
+            if key is not None and apex_class is not None:
+                self.cache.put(key, apex_class)
+                if stat_key is not None:
+                    self.cache.put(stat_key, key)
+            return apex_class
+        except Exception as e:
+            print(f"Error parsing {file_path}: {str(e)}")
+            return None
+
+    def parse_source(self, file_path: Path, raw: bytes) -> Optional[ApexClass]:
+        """
+            Parse an Apex class from bytes the caller already read from file_path.
+            
+            For callers that read the file themselves (for example to key their
+            own cache), so it is not read a second time. This parser's on-disk
+            cache is not consulted.
+        """
+        try:
+            return self._parse_class_content(_decode_source(raw), file_path)
         except Exception as e:
             print(f"Error parsing {file_path}: {str(e)}")
             return None
@@ -519,93 +900,142 @@ class ApexParser:
     def _parse_class_content(self, content: str, file_path: Path) -> Optional[ApexClass]:
         """
             Parse the content of an Apex class.
+            
+            Results are memoized in an LRU of MAX_CONTENT_CACHE_ENTRIES entries keyed
+            by a digest of the content and path, so identical content (including
+            inner class bodies) is only parsed once. Cached classes are shared
+            between callers and must not be mutated.
+        """
+        # Paths cannot contain NUL, so it safely separates the path from the content
+        key = hashlib.blake2b(
+            os.fsencode(file_path) + b'\0' + content.encode('utf-8'), digest_size=16
+        ).digest()
+        cache = self._content_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        apex_class = self._parse_class_content_uncached(content, file_path)
+        cache[key] = apex_class
+        if len(cache) > self.MAX_CONTENT_CACHE_ENTRIES:
+            cache.popitem(last=False)
+        return apex_class
+
+    def _parse_class_content_uncached(self, content: str, file_path: Path) -> Optional[ApexClass]:
+        """
+            Parse the content of an Apex class without consulting the content cache.
         """
-        class_match = self.class_pattern.search(content)
+        class_match, class_body, _ = next(self._iter_blocks(self.class_pattern, content),
+                                          (None, None, None))
         if not class_match:
             return None
-        class_dict = class_match.groupdict()
-        # Parse modifiers including sharing
-        modifiers = [ApexModifier(mod.strip()) 
-                    for mod in class_dict['modifiers'].split()
-                    if mod.strip()]
-        if class_dict['sharing']:
-            sharing_mod = ApexModifier(class_dict['sharing'].strip())
-            modifiers.append(sharing_mod)
+        # Parse modifiers including sharing, which may appear anywhere among them.
+        # 'sharing' only ever follows a sharing keyword, which stands for the pair
+        modifiers = [
+            _SHARING_LOOKUP[mod] if mod in _SHARING_LOOKUP else _MOD_LOOKUP[mod]
+            for mod in class_match['modifiers'].split() if mod != 'sharing'
+        ]
         # Parse interfaces
         interfaces = []
-        if class_dict['interfaces']:
-            interfaces = [i.strip() for i in class_dict['interfaces'].split(',')]
+        if class_match['interfaces']:
+            interfaces = [i.strip() for i in class_match['interfaces'].split(',')]
         # Parse annotations
-        annotations = self._parse_annotations(class_dict['annotations'] or '')
-        # Parse doc comment
+        annotations = self._parse_annotations(class_match['annotations'] or '')
+        # Parse doc comment: the last one before the class header, like methods.
+        # endpos bounds the search without copying the file prefix
         doc_comment = None
-        doc_match = self.doc_comment_pattern.search(content[:class_match.start()])
+        doc_match = None
+        for doc_match in self.doc_comment_pattern.finditer(content, 0, class_match.start()):
+            pass
         if doc_match:
             doc_comment = doc_match.group('comment').strip()
         # Parse components
-        methods = self._parse_methods(class_dict['body'])
-        properties = self._parse_properties(class_dict['body'])
-        inner_classes = self._parse_inner_classes(class_dict['body'])
+        # Cached and pickled classes hold lists, so the streams are materialized here
+        methods = list(self._iter_methods(class_body))
+        properties = list(self._iter_properties(class_body))
+        inner_classes = self._parse_inner_classes(class_body)
         return ApexClass(
-            name=class_dict['name'],
+            name=class_match['name'],
             file_path=str(file_path),
             modifiers=modifiers,
             annotations=annotations,
             methods=methods,
             properties=properties,
-            superclass=class_dict['superclass'],
+            superclass=class_match['superclass'],
             interfaces=interfaces,
             inner_classes=inner_classes,
-            doc_comment=doc_comment
+            doc_comment=doc_comment,
+            calls=frozenset().union(*[method.calls for method in methods])
         )
 
-    def _parse_methods(self, class_body: str) -> List[ApexMethod]:
+    def _iter_methods(self, class_body: str) -> Iterator[ApexMethod]:
         """
-            Extract methods from class body.
+            Extract methods from class body, yielding each as it is parsed.
+            
+            Doc comments are scanned lazily, alongside the methods, so scanning
+            stops at the last method's header; a method's doc comment is the
+            last one between the end of the previous method and its own start.
         """
-        methods = []
-        for match in self.method_pattern.finditer(class_body):
-            method_dict = match.groupdict()
+        doc_matches = self.doc_comment_pattern.finditer(class_body)
+        doc_match = next(doc_matches, None)
+        previous_end = 0
+        newlines = _newline_offsets(class_body)
+        for match, body, end in self._iter_blocks(self.method_pattern, class_body):
             # Parse annotations
-            annotations = self._parse_annotations(method_dict['annotations'] or '')
+            annotations = self._parse_annotations(match['annotations'] or '')
             # Parse modifiers
-            modifiers = [ApexModifier(mod.strip()) 
-                        for mod in method_dict['modifiers'].split()
-                        if mod.strip()]
+            modifiers = [_MOD_LOOKUP[mod] for mod in match['modifiers'].split()]
             # Parse parameters
-            parameters = self._parse_parameters(method_dict['params'])
+            parameters = self._parse_parameters(match['params'])
             # Calculate line number
-            line_number = class_body[:match.start()].count('\n') + 1
+            line_number = bisect_left(newlines, match.start()) + 1
             # Parse method body
-            calls, dml_operations, soql_queries = self._parse_method_body(
-                method_dict['body'],
-                line_number
-            )
+            if self.parse_bodies:
+                calls, dml_operations, soql_queries = self._parse_method_body(
+                    body,
+                    match.end(),
+                    newlines
+                )
+            else:
+                calls, dml_operations, soql_queries = frozenset(), [], []
             # Parse doc comment
             doc_comment = None
-            doc_match = self.doc_comment_pattern.search(class_body[:match.start()])
-            if doc_match:
-                doc_comment = doc_match.group('comment').strip()
-            methods.append(ApexMethod(
-                name=method_dict['name'],
-                return_type=method_dict['return_type'],
+            while doc_match is not None and doc_match.end() <= match.start():
+                if doc_match.start() >= previous_end:
+                    doc_comment = doc_match.group('comment').strip()
+                doc_match = next(doc_matches, None)
+            previous_end = end
+            yield ApexMethod(
+                name=match['name'],
+                return_type=sys.intern(match['return_type']),
                 parameters=parameters,
                 modifiers=modifiers,
                 annotations=annotations,
-                body=method_dict['body'],
+                body=body,
                 calls=calls,
                 dml_operations=dml_operations,
                 soql_queries=soql_queries,
                 line_number=line_number,
                 doc_comment=doc_comment
-            ))
-        return methods
+            )
 
-    def _parse_properties(self, class_body: str) -> List[ApexProperty]:
+    def _iter_properties(self, class_body: str) -> Iterator[ApexProperty]:
         """
-            Extract properties from class body.
+            Extract properties from class body, yielding each as it is parsed.
+            
+            Headers that open something other than accessors, such as a class or
+            enum body, are searched inside rather than skipped.
         """
-        properties = []
-        for match in self.property_pattern.finditer(class_body):
-            properties.append(self._parse_property(match))
-        return properties
\ No newline at end of file
+        pos = 0
+        while True:
+            match = self.property_pattern.search(class_body, pos)
+            if not match:
+                return
+            pos = match.end()
+            # Check for an accessor before scanning for the end of a possibly large block
+            if not self.accessor_start_pattern.match(class_body, pos):
+                continue
+            close_brace = _find_block_end(class_body, pos - 1)
+            if close_brace == -1:
+                continue
+            yield self._parse_property(match, class_body[pos:close_brace])
+            pos = close_brace + 1
\ No newline at end of file
@@ -3,33 +3,132 @@
     This module provides the main CLI interface for analyzing Salesforce org metadata,
     generating documentation, and visualizing automation execution paths.
 """
+import importlib
 import logging
+import os
+import re
+import sys
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, List, Optional
 import click
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn
-# Import core components for analysis and visualization
-from src.utils.sfdx_helper import SFDXHelper, ConfigManager, LogManager
-from src.execution.path_analyzer import ExecutionPathAnalyzer
-from src.execution.visualizer import ExecutionPathVisualizer
-from src.llm.documenter import LLMDocumenter
+# Import core components; subcommands live in src.commands and are imported
+# only when invoked, so the analyzer, visualizer and LLM documenter (which
+# pulls in torch and transformers) never load for --help, configure or version
+from src.utils.parse_cache import ParseCache
+from src.utils.sfdx_helper import SFDXHelper, ConfigManager, LogManager, config_cache_dir
+# Rich is only imported for interactive terminals; piped and CI output is plain text
+_TTY = sys.stdout.isatty()
+# Rich markup tags such as [red], [bold green], [link=...] and [/], stripped from
+# plain output; same shape rich itself treats as a tag
+_MARKUP_RE = re.compile(r'\[[a-z#/@][^\[\]]*\]')
+
+class _PlainConsole:
+    """
+        Stand-in for rich's Console that prints text with style tags removed.
+        
+        Implements the Console methods the subcommands use: print and screen.
+    """
+    
+    def print(self, *objects, sep: str = ' ', end: str = '\n', **kwargs):
+        print(*(_MARKUP_RE.sub('', str(obj)) for obj in objects), sep=sep, end=end, flush=True)
+    
+    def screen(self, *args, **kwargs):
+        # There is no alternate screen without a terminal; output stays inline
+        return nullcontext(self)
+
+class _NullProgress:
+    """
+        Stand-in for rich's Progress that displays nothing.
+    """
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def add_task(self, *args, **kwargs) -> int:
+        return 0
+    
+    def update(self, *args, **kwargs):
+        pass
+
 # Initialize rich console for enhanced terminal output
-console = Console()
+if _TTY:
+    from rich.console import Console
+    console = Console()
+else:
+    console = _PlainConsole()
 logger = logging.getLogger(__name__)
+# Directories this process has already created or found, so repeat requests skip the syscall
+_MKDIR_CACHE = set()
+
+def _ensure_dir(path: Path):
+    """
+        Create a directory and its parents unless this process already did.
+        
+        Args:
+            path: Directory to create
+    """
+    key = os.fspath(path)
+    if key in _MKDIR_CACHE:
+        return
+    os.makedirs(key, exist_ok=True)
+    _MKDIR_CACHE.add(key)
+
+def _progress():
+    """
+        Create the progress display for a long-running command.
+        
+        Returns:
+            A rich Progress with a spinner on terminals, otherwise a _NullProgress
+    """
+    if not _TTY:
+        return _NullProgress()
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
 
 def setup_logging():
     """
         Configure logging with rich output for enhanced readability.
-        Uses RichHandler for formatted console output with tracebacks.
+        Uses RichHandler for formatted console output with tracebacks on
+        terminals, and plain messages otherwise.
     """
+    if not _TTY:
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+        return
+    from rich.logging import RichHandler
     logging.basicConfig(
         level=logging.INFO,
         format="%(message)s",
         handlers=[RichHandler(console=console, rich_tracebacks=True)]
     )
 
+@lru_cache(maxsize=8)
+def _get_helper(path: Path) -> SFDXHelper:
+    """
+        Create and validate the SFDXHelper for a project once per process.
+        
+        Shared by validate_project_path and cli(), which would otherwise each
+        build their own helper and stat sfdx-project.json again.
+        
+        Args:
+            path: Project root path
+        
+        Returns:
+            SFDXHelper: Validated helper for the project
+        
+        Raises:
+            ValueError: If path is not a valid SFDX project (not cached)
+    """
+    return SFDXHelper(path)
+
 def validate_project_path(ctx, param, value):
     """
         Validate that the provided path contains a valid SFDX project.
@@ -40,19 +139,68 @@ def validate_project_path(ctx, param, value):
             value: Project path to validate
         
         Returns:
-            Path: Validated project path
+            Optional[Path]: Validated project path, None if not given
         
         Raises:
             click.BadParameter: If path is not a valid SFDX project
     """
+    if value is None:
+        # Optional for commands that do not read the project, such as version
+        return None
     path = Path(value)
     try:
-        SFDXHelper(path)._validate_sfdx_project()
+        _get_helper(path)
         return path
     except ValueError as e:
         raise click.BadParameter(str(e))
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+        Click group that imports its subcommands only when they are needed.
+        
+        Args:
+            lazy_subcommands: Mapping of command name to 'module:attribute'
+        
+        Example:
+            >>> @click.group(cls=LazyGroup, lazy_subcommands={'version': 'src.commands.version:version'})
+            ... def cli():
+            ...     pass
+    """
+    
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+    
+    def get_command(self, ctx, cmd_name: str) -> Optional[click.Command]:
+        # Only the requested name is resolved, so an invocation builds the
+        # one subcommand it runs; --help resolves each once for its summary
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._load_command(cmd_name)
+        return command
+    
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import the module behind a lazy subcommand and register its command."""
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(':', 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand {cmd_name} did not resolve to a click command")
+        # Later lookups of this name are a plain dict hit
+        self.add_command(command, cmd_name)
+        return command
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        'analyze': 'src.commands.analyze:analyze',
+        'configure': 'src.commands.configure:configure',
+        'version': 'src.commands.version:version',
+        'visualize': 'src.commands.visualize:visualize',
+    }
+)
 @click.option(
     '--project-path', 
     type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
@@ -65,8 +213,13 @@ def validate_project_path(ctx, param, value):
     help='Path to configuration file'
 )
 @click.option('--debug/--no-debug', default=False, help='Enable debug logging')
+@click.option(
+    '--clear-cache',
+    is_flag=True,
+    help='Remove cached configuration and Apex parse results before running'
+)
 @click.pass_context
-def cli(ctx, project_path: Path, config: Optional[Path], debug: bool):
+def cli(ctx, project_path: Optional[Path], config: Optional[Path], debug: bool, clear_cache: bool):
     """
         Main entry point for the Salesforce Org Analyzer CLI.
         Initializes configuration and logging, and sets up the CLI context.
@@ -74,6 +227,11 @@ def cli(ctx, project_path: Path, config: Optional[Path], debug: bool):
     setup_logging()
     if debug:
         logging.getLogger().setLevel(logging.DEBUG)
+    if clear_cache:
+        # Entries from older versions are never read again; this reclaims their space
+        from src.apex.analyzer import DEFAULT_CACHE_DIR
+        removed = sum(ParseCache(cache_dir).clear() for cache_dir in (config_cache_dir(), DEFAULT_CACHE_DIR))
+        console.print(f"Removed {removed} cache entries")
     # Initialize configuration and logging
     try:
         config_manager = ConfigManager(config)
@@ -85,296 +243,29 @@ def cli(ctx, project_path: Path, config: Optional[Path], debug: bool):
     ctx.ensure_object(dict)
     ctx.obj['project_path'] = project_path
     ctx.obj['config'] = config_manager.config
-    ctx.obj['sfdx_helper'] = SFDXHelper(project_path)
+    ctx.obj['sfdx_helper'] = _get_helper(project_path) if project_path is not None else None
 
-@cli.command()
-@click.option(
-    '--objects', 
-    help='Comma-separated list of objects to analyze'
-)
-@click.option(
-    '--output-dir', 
-    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
-    default='documentation',
-    help='Output directory for analysis results'
-)
-@click.option(
-    '--skip-llm/--use-llm',
-    default=False,
-    help='Skip LLM documentation generation'
-)
-@click.pass_context
-def analyze(ctx, objects: Optional[str], output_dir: Path, skip_llm: bool):
+def _require_helper(ctx) -> SFDXHelper:
     """
-        Analyze Salesforce org automation and generate documentation.
-        
-        Performs comprehensive analysis of Salesforce automation for specified objects,
-        generating documentation and visualization diagrams for execution paths.
+        Return the SFDX helper of the invocation, for commands that read the project.
         
         Args:
-            ctx: Click context object containing configuration and helper instances
-                - project_path: Path to SFDX project
-                - config: Loaded configuration dictionary
-                - sfdx_helper: Initialized SFDXHelper instance
-            objects: Comma-separated string of Salesforce object names to analyze
-                Example: "Account,Contact,Opportunity"
-            output_dir: Directory path where analysis results will be saved
-                Creates subdirectories for each analyzed object
-            skip_llm: Boolean flag to skip LLM-based documentation generation
-                True: Generate basic documentation only
-                False: Include AI-generated documentation
+            ctx: Click context of the running subcommand
         
         Returns:
-            None
+            SFDXHelper: Helper for the --project-path project
         
         Raises:
-            click.ClickException: If project validation fails or critical errors occur
-            Exception: Handles individual object analysis failures without stopping execution
-        
-        Output Structure:
-            output_dir/
-            ├── Object1/
-            │   └── documentation.md
-            ├── Object2/
-            │   └── documentation.md
-            └── ...
-                
-        Documentation Contents:
-            - Overview (LLM-generated if enabled)
-            - Technical Details
-            - Business Impact Analysis
-            - Automation Entry Points
-            - Recursion Risks
-            - Mermaid Execution Path Diagrams
-    """
-    sfdx_helper: SFDXHelper = ctx.obj['sfdx_helper']
-    config = ctx.obj['config']
-
-    # Ensure output directory exists
-    output_dir.mkdir(exist_ok=True)
-    # Parse object list from comma-separated string
-    object_list = objects.split(',') if objects else None
-    # Initialize progress display
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        try:
-            # Verify project structure
-            task = progress.add_task("Verifying SFDX project...", total=None)
-            project_path = ctx.obj['project_path']
-            if not (project_path / 'sfdx-project.json').exists():
-                raise click.ClickException(
-                    f"No sfdx-project.json found in {project_path}. "
-                    "Please ensure this is a valid Salesforce project directory."
-                )
-            # Ensure manifest directory exists for metadata retrieval
-            manifest_dir = project_path / 'manifest'
-            manifest_dir.mkdir(exist_ok=True)
-            # Retrieve metadata for specified objects
-            progress.update(task, description="Fetching metadata...")
-            if object_list:
-                metadata_types = ['CustomObject', 'ApexTrigger', 'Flow', 'WorkflowRule']
-                package_xml = sfdx_helper.create_package_xml(metadata_types)
-                if not sfdx_helper.retrieve_source(package_xml):
-                    console.print("[yellow]Warning: Some metadata retrieval failed[/yellow]")
-            # Initialize analysis components
-            analyzer = ExecutionPathAnalyzer(config)
-            visualizer = ExecutionPathVisualizer(config)
-            # Initialize LLM documentation generator if enabled
-            if not skip_llm:
-                try:
-                    documenter = LLMDocumenter(config)
-                except Exception as e:
-                    console.print(f"[yellow]Warning: LLM initialization failed: {str(e)}[/yellow]")
-                    console.print("[yellow]Continuing without LLM documentation[/yellow]")
-                    skip_llm = True
-            # Process each object
-            for obj in object_list or []:
-                try:
-                    # Analyze automation and execution paths
-                    progress.update(task, description=f"Analyzing {obj}...")
-                    analysis_result = analyzer.analyze_object(obj, {})
-                    # Generate LLM documentation if enabled
-                    if not skip_llm:
-                        progress.update(task, description=f"Generating documentation for {obj}...")
-                        doc_result = documenter.generate_documentation(analysis_result)
-                    else:
-                        doc_result = None
-                    # Generate execution path diagrams
-                    progress.update(task, description=f"Generating diagrams for {obj}...")
-                    diagram = visualizer.generate_mermaid(analysis_result)
-                    # Create output directory for object
-                    obj_dir = output_dir / obj
-                    obj_dir.mkdir(exist_ok=True)
-                    # Write documentation and diagrams to file
-                    with open(obj_dir / 'documentation.md', 'w') as f:
-                        f.write(f"# {obj} Automation Analysis\n\n")
-                        if doc_result:
-                            # Include LLM-generated documentation
-                            f.write(f"## Overview\n\n{doc_result.overview}\n\n")
-                            f.write(f"## Technical Details\n\n{doc_result.technical_details}\n\n")
-                            f.write(f"## Business Impact\n\n{doc_result.business_impact}\n\n")
-                            f.write("## Recommendations\n\n")
-                            for rec in doc_result.recommendations:
-                                f.write(f"- {rec}\n")
-                        else:
-                            # Include basic analysis results
-                            f.write("## Analysis Results\n\n")
-                            f.write(f"Found {len(analysis_result.entry_points)} automation entry points.\n\n")
-                            if analysis_result.recursion_risks:
-                                f.write("### Potential Risks\n\n")
-                                for risk in analysis_result.recursion_risks:
-                                    f.write(f"- {risk}\n")
-                        # Include execution path diagram
-                        f.write("\n## Execution Path Diagram\n\n")
-                        f.write("```mermaid\n")
-                        f.write(diagram)
-                        f.write("\n```\n")
-                    console.print(f"[green]✓[/green] Completed analysis of {obj}")
-                except Exception as e:
-                    console.print(f"[red]Error analyzing {obj}: {str(e)}[/red]")
-                    logger.exception(f"Error analyzing {obj}")
-        except Exception as e:
-            raise click.ClickException(str(e))
-
-@cli.command()
-@click.option(
-    '--object', 
-    required=True,
-    help='Object to visualize'
-)
-@click.option(
-    '--context',
-    type=click.Choice(['before_insert', 'after_insert', 'before_update', 'after_update',
-                      'before_delete', 'after_delete', 'after_undelete']),
-    help='Specific trigger context to visualize'
-)
-@click.option(
-    '--output-dir', 
-    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
-    default='diagrams',
-    help='Output directory for diagrams'
-)
-
-@click.pass_context
-def visualize(ctx, object: str, context: Optional[str], output_dir: Path):
-    """
-        Generate visualization of execution paths for a specific object.
-        Creates Mermaid diagrams showing automation execution paths. Can focus
-        on a specific trigger context or show all contexts for the object.
-        
-        Args:
-            ctx: Click context containing configuration and helpers
-            object: Name of the Salesforce object to visualize
-            context: Optional trigger context to filter visualization
-            output_dir: Directory where diagram files will be saved
-    """
-    config = ctx.obj['config']
-    # Ensure output directory exists
-    output_dir.mkdir(exist_ok=True)
-    try:
-        # Initialize analysis components
-        analyzer = ExecutionPathAnalyzer(config)
-        visualizer = ExecutionPathVisualizer(config)
-        # Analyze object's automation and execution paths
-        analysis_result = analyzer.analyze_object(object, {})
-        # Generate appropriate diagram based on context
-        if context:
-            # Generate diagram for specific trigger context
-            diagram = visualizer.generate_mermaid(analysis_result, context)
-            filename = f"{object}_{context}_execution_path.mmd"
-        else:
-            # Generate diagram for all contexts
-            diagram = visualizer.generate_mermaid(analysis_result)
-            filename = f"{object}_execution_paths.mmd"
-        # Save diagram to file
-        with open(output_dir / filename, 'w') as f:
-            f.write(diagram)
-        console.print(f"[green]✓[/green] Generated diagram: {filename}")
-    except Exception as e:
-        console.print(f"[red]Error generating visualization: {str(e)}[/red]")
-        logger.exception("Error generating visualization")
-
-@cli.command()
-@click.pass_context
-def configure(ctx):
-    """
-        Interactive configuration for the analyzer.
-
-        Allows users to customize:
-            - LLM settings for documentation generation
-            - Analysis parameters for code parsing
-            - Visualization options for diagrams
-
-        Updates are saved to the configuration file for future use.
-    """
-    config = ctx.obj['config']
-    config_manager = ConfigManager()
-    # Store configuration updates
-    updates = {}
-    # Create interactive configuration screen
-    with console.screen():
-        console.print("[bold]Salesforce Org Analyzer Configuration[/bold]\n")
-        # Configure LLM settings
-        updates['llm'] = {
-            'model': click.prompt(
-                "LLM Model",
-                default=config['llm']['model']
-            ),
-            'temperature': click.prompt(
-                "Temperature",
-                default=config['llm']['temperature'],
-                type=float
-            ),
-        }
-        # Configure analysis settings
-        updates['analysis'] = {
-            'parser': {
-                'include_inner_classes': click.confirm(
-                    "Include inner classes?",
-                    default=config['analysis']['parser']['include_inner_classes']
-                ),
-                'parse_annotations': click.confirm(
-                    "Parse annotations?",
-                    default=config['analysis']['parser']['parse_annotations']
-                )
-            }
-        }
-        # Configure visualization settings
-        updates['visualization'] = {
-            'include_conditions': click.confirm(
-                "Include conditions in diagrams?",
-                default=config['visualization']['include_conditions']
-            ),
-            'show_dml_operations': click.confirm(
-                "Show DML operations in diagrams?",
-                default=config['visualization']['show_dml_operations']
-            )
-        }
-    # Save configuration updates
-    try:
-        config_manager.update_config(updates)
-        console.print("[green]✓[/green] Configuration updated successfully")
-    except Exception as e:
-        console.print(f"[red]Error updating configuration: {str(e)}[/red]")
-
-@cli.command()
-def version():
+            click.UsageError: If --project-path was not given
     """
-        Display the current version of the Salesforce Org Analyzer.    
-        Retrieves version information from the package metadata.
-        If the package is not installed via pip/poetry, version info may not be available.
-    """
-    import pkg_resources
-    try:
-        # Attempt to get version from package metadata
-        version = pkg_resources.get_distribution('salesforce-analyzer').version
-        console.print(f"Salesforce Org Analyzer v{version}")
-    except pkg_resources.DistributionNotFound:
-        console.print("Version information not available")
+    sfdx_helper = ctx.obj.get('sfdx_helper')
+    if sfdx_helper is None:
+        raise click.UsageError('--project-path is required for this command', ctx=ctx)
+    return sfdx_helper
 
 if __name__ == '__main__':
-    # Entry point when script is run directly
+    # Entry point when script is run directly. Subcommand modules import
+    # console and logger from src.cli, so alias this module under that name
+    # rather than letting them execute and register a second copy of it
+    sys.modules.setdefault('src.cli', sys.modules[__name__])
     cli(obj={})
\ No newline at end of file
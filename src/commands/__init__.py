@@ -0,0 +1,3 @@
+"""
+    CLI subcommands, one module each, imported on demand by the cli group.
+"""
\ No newline at end of file
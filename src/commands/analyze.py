@@ -0,0 +1,216 @@
+"""
+    Analyze command: automation analysis and documentation for Salesforce objects.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+import click
+from src.cli import _ensure_dir, _require_helper, _progress, console, logger
+from src.utils.sfdx_helper import SFDXHelper
+
+def _process_one(
+    obj: str,
+    analyzer,
+    metadata: dict,
+    visualizer,
+    documenter,
+    documenter_lock: threading.Lock,
+    output_dir: Path,
+) -> Path:
+    """
+        Analyze one object and write its documentation.
+        
+        Runs on a worker thread of analyze(). The LLM documenter shares one
+        model across workers, so generation is serialized by documenter_lock;
+        its output is streamed into a temporary file that replaces
+        documentation.md once complete.
+        
+        Args:
+            obj: API name of the object to analyze
+            analyzer: ExecutionPathAnalyzer owned by this call
+            metadata: Shared metadata index from SFDXHelper.load_all_metadata
+            visualizer: Shared ExecutionPathVisualizer
+            documenter: Shared LLMDocumenter, or None when LLM output is skipped
+            documenter_lock: Lock guarding the documenter
+            output_dir: Root output directory
+        
+        Returns:
+            Path: The written documentation file
+    """
+    # Analyze automation and execution paths
+    analysis_result = analyzer.analyze_object(obj, metadata)
+    # Generate execution path diagrams
+    diagram = visualizer.generate_mermaid(analysis_result)
+    diagram_section = f"\n## Execution Path Diagram\n\n```mermaid\n{diagram}\n```\n"
+    # Create output directory for object
+    obj_dir = output_dir / obj
+    _ensure_dir(obj_dir)
+    doc_path = obj_dir / 'documentation.md'
+    if documenter is None:
+        # Assemble basic analysis results and diagrams, then write the file in one call
+        parts = [f"# {obj} Automation Analysis\n\n", "## Analysis Results\n\n"]
+        parts.append(f"Found {len(analysis_result.entry_points)} automation entry points.\n\n")
+        if analysis_result.recursion_risks:
+            parts.append("### Potential Risks\n\n")
+            parts.extend(f"- {risk}\n" for risk in analysis_result.recursion_risks)
+        parts.append(diagram_section)
+        doc_path.write_text(''.join(parts))
+        return doc_path
+    # Stream LLM-generated documentation to a temporary file as it is produced,
+    # moved into place only once complete so an aborted run leaves no partial file
+    from src.llm.documenter import DOCUMENTATION_SECTIONS
+    tmp_path = doc_path.with_name(f"{doc_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f, documenter_lock:
+            f.write(f"# {obj} Automation Analysis\n\n")
+            section = None
+            for key, chunk in documenter.stream_documentation(analysis_result):
+                if key != section:
+                    # Start a new section, separated from the previous one
+                    if section is not None:
+                        f.write("\n")
+                    f.write(f"## {DOCUMENTATION_SECTIONS[key]}\n\n")
+                    section = key
+                f.write(chunk)
+                f.flush()
+            f.write(diagram_section)
+        os.replace(tmp_path, doc_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return doc_path
+
+@click.command()
+@click.option(
+    '--objects', 
+    help='Comma-separated list of objects to analyze'
+)
+@click.option(
+    '--output-dir', 
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default='documentation',
+    help='Output directory for analysis results'
+)
+@click.option(
+    '--skip-llm/--use-llm',
+    default=False,
+    help='Skip LLM documentation generation'
+)
+@click.pass_context
+def analyze(ctx, objects: Optional[str], output_dir: Path, skip_llm: bool):
+    """
+        Analyze Salesforce org automation and generate documentation.
+        
+        Performs comprehensive analysis of Salesforce automation for specified objects,
+        generating documentation and visualization diagrams for execution paths.
+        
+        Args:
+            ctx: Click context object containing configuration and helper instances
+                - project_path: Path to SFDX project
+                - config: Loaded configuration dictionary
+                - sfdx_helper: Initialized SFDXHelper instance
+            objects: Comma-separated string of Salesforce object names to analyze
+                Example: "Account,Contact,Opportunity"
+            output_dir: Directory path where analysis results will be saved
+                Creates subdirectories for each analyzed object
+            skip_llm: Boolean flag to skip LLM-based documentation generation
+                True: Generate basic documentation only
+                False: Include AI-generated documentation
+        
+        Returns:
+            None
+        
+        Raises:
+            click.ClickException: If project validation fails or critical errors occur
+            Exception: Handles individual object analysis failures without stopping execution
+        
+        Output Structure:
+            output_dir/
+            ├── Object1/
+            │   └── documentation.md
+            ├── Object2/
+            │   └── documentation.md
+            └── ...
+                
+        Documentation Contents:
+            - Overview (LLM-generated if enabled)
+            - Technical Details
+            - Business Impact Analysis
+            - Automation Entry Points
+            - Recursion Risks
+            - Mermaid Execution Path Diagrams
+    """
+    from src.execution.path_analyzer import ExecutionPathAnalyzer
+    from src.execution.visualizer import ExecutionPathVisualizer
+    sfdx_helper: SFDXHelper = _require_helper(ctx)
+    config = ctx.obj['config']
+
+    # Ensure output directory exists
+    _ensure_dir(output_dir)
+    # Parse object list from comma-separated string
+    object_list = objects.split(',') if objects else None
+    # Initialize progress display
+    with _progress() as progress:
+        try:
+            # Verify project structure
+            task = progress.add_task("Verifying SFDX project...", total=None)
+            project_path = ctx.obj['project_path']
+            if not (project_path / 'sfdx-project.json').exists():
+                raise click.ClickException(
+                    f"No sfdx-project.json found in {project_path}. "
+                    "Please ensure this is a valid Salesforce project directory."
+                )
+            # Ensure manifest directory exists for metadata retrieval
+            manifest_dir = project_path / 'manifest'
+            _ensure_dir(manifest_dir)
+            # Retrieve metadata for specified objects
+            progress.update(task, description="Fetching metadata...")
+            if object_list:
+                metadata_types = ['CustomObject', 'ApexTrigger', 'Flow', 'WorkflowRule']
+                package_xml = sfdx_helper.create_package_xml(metadata_types)
+                if not sfdx_helper.retrieve_source(package_xml):
+                    console.print("[yellow]Warning: Some metadata retrieval failed[/yellow]")
+            # Index retrieved metadata once; every object's analysis filters it
+            progress.update(task, description="Indexing metadata...")
+            shared_meta = sfdx_helper.load_all_metadata()
+            # Initialize analysis components; the path analyzer keeps per-run
+            # state, so each object gets its own instance below
+            visualizer = ExecutionPathVisualizer(config)
+            # Initialize LLM documentation generator if enabled
+            if not skip_llm:
+                try:
+                    from src.llm.documenter import LLMDocumenter
+                    documenter = LLMDocumenter(config)
+                except Exception as e:
+                    console.print(f"[yellow]Warning: LLM initialization failed: {str(e)}[/yellow]")
+                    console.print("[yellow]Continuing without LLM documentation[/yellow]")
+                    skip_llm = True
+            # Process objects concurrently; LLM generation and file I/O are
+            # latency-bound, so threads overlap one object's waits with another's
+            pending = object_list or []
+            max_workers = config.get('execution', {}).get('parallelism', 8)
+            documenter_lock = threading.Lock()
+            progress.update(task, description=f"Analyzing {len(pending)} objects...")
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(pending) or 1))
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _process_one, obj, ExecutionPathAnalyzer(config), shared_meta, visualizer,
+                        None if skip_llm else documenter, documenter_lock, output_dir
+                    ): obj
+                    for obj in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    obj = futures[future]
+                    progress.update(task, description=f"Analyzed {done}/{len(pending)} objects...")
+                    try:
+                        future.result()
+                        console.print(f"[green]✓[/green] Completed analysis of {obj}")
+                    except Exception as e:
+                        console.print(f"[red]Error analyzing {obj}: {str(e)}[/red]")
+                        logger.exception(f"Error analyzing {obj}")
+        except Exception as e:
+            raise click.ClickException(str(e))
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+    Configure command: interactive editing of the analyzer configuration.
+"""
+import click
+from src.cli import console
+from src.utils.sfdx_helper import ConfigManager
+
+@click.command()
+@click.pass_context
+def configure(ctx):
+    """
+        Interactive configuration for the analyzer.
+
+        Allows users to customize:
+            - LLM settings for documentation generation
+            - Analysis parameters for code parsing
+            - Visualization options for diagrams
+
+        Updates are saved to the configuration file for future use.
+    """
+    config = ctx.obj['config']
+    config_manager = ConfigManager()
+    # Store configuration updates
+    updates = {}
+    # Create interactive configuration screen
+    with console.screen():
+        console.print("[bold]Salesforce Org Analyzer Configuration[/bold]\n")
+        # Configure LLM settings
+        updates['llm'] = {
+            'model': click.prompt(
+                "LLM Model",
+                default=config['llm']['model']
+            ),
+            'temperature': click.prompt(
+                "Temperature",
+                default=config['llm']['temperature'],
+                type=float
+            ),
+        }
+        # Configure analysis settings
+        updates['analysis'] = {
+            'parser': {
+                'include_inner_classes': click.confirm(
+                    "Include inner classes?",
+                    default=config['analysis']['parser']['include_inner_classes']
+                ),
+                'parse_annotations': click.confirm(
+                    "Parse annotations?",
+                    default=config['analysis']['parser']['parse_annotations']
+                )
+            }
+        }
+        # Configure visualization settings
+        updates['visualization'] = {
+            'include_conditions': click.confirm(
+                "Include conditions in diagrams?",
+                default=config['visualization']['include_conditions']
+            ),
+            'show_dml_operations': click.confirm(
+                "Show DML operations in diagrams?",
+                default=config['visualization']['show_dml_operations']
+            )
+        }
+    # Save configuration updates
+    try:
+        config_manager.update_config(updates)
+        console.print("[green]✓[/green] Configuration updated successfully")
+    except Exception as e:
+        console.print(f"[red]Error updating configuration: {str(e)}[/red]")
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""
+    Version command: reports the installed package version.
+"""
+from importlib.metadata import PackageNotFoundError, version as package_version
+import click
+from src.cli import console
+
+@click.command()
+def version():
+    """
+        Display the current version of the Salesforce Org Analyzer.    
+        Retrieves version information from the package metadata.
+        If the package is not installed via pip/poetry, version info may not be available.
+    """
+    try:
+        # Read the installed distribution's metadata directly; pkg_resources
+        # would import setuptools and scan every distribution on sys.path
+        console.print(f"Salesforce Org Analyzer v{package_version('salesforce-analyzer')}")
+    except PackageNotFoundError:
+        console.print("Version information not available")
\ No newline at end of file
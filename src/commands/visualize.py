@@ -0,0 +1,71 @@
+"""
+    Visualize command: Mermaid diagrams of an object's execution paths.
+"""
+from pathlib import Path
+from typing import Optional
+import click
+from src.cli import _ensure_dir, _require_helper, console, logger
+
+@click.command()
+@click.option(
+    '--object', 
+    required=True,
+    help='Object to visualize'
+)
+@click.option(
+    '--context',
+    type=click.Choice(['before_insert', 'after_insert', 'before_update', 'after_update',
+                      'before_delete', 'after_delete', 'after_undelete']),
+    help='Specific trigger context to visualize'
+)
+@click.option(
+    '--output-dir', 
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default='diagrams',
+    help='Output directory for diagrams'
+)
+
+@click.pass_context
+def visualize(ctx, object: str, context: Optional[str], output_dir: Path):
+    """
+        Generate visualization of execution paths for a specific object.
+        Creates Mermaid diagrams showing automation execution paths. Can focus
+        on a specific trigger context or show all contexts for the object.
+        
+        Args:
+            ctx: Click context containing configuration and helpers
+            object: Name of the Salesforce object to visualize
+            context: Optional trigger context to filter visualization
+            output_dir: Directory where diagram files will be saved
+    """
+    from src.execution.path_analyzer import ExecutionPathAnalyzer
+    from src.execution.visualizer import ExecutionPathVisualizer
+    from src.models.analysis_models import TriggerContext
+    config = ctx.obj['config']
+    sfdx_helper = _require_helper(ctx)
+    # Ensure output directory exists
+    _ensure_dir(output_dir)
+    try:
+        # Initialize analysis components
+        analyzer = ExecutionPathAnalyzer(config)
+        visualizer = ExecutionPathVisualizer(config)
+        # Index retrieved metadata, then analyze the object's automation and execution paths
+        metadata = sfdx_helper.load_all_metadata()
+        analysis_result = analyzer.analyze_object(object, metadata)
+        # Generate appropriate diagram based on context
+        if context:
+            # Generate diagram for specific trigger context
+            # Execution paths are keyed by TriggerContext, e.g. 'after_update' -> 'after update'
+            diagram = visualizer.generate_mermaid(analysis_result, TriggerContext(context.replace('_', ' ')))
+            filename = f"{object}_{context}_execution_path.mmd"
+        else:
+            # Generate diagram for all contexts
+            diagram = visualizer.generate_mermaid(analysis_result)
+            filename = f"{object}_execution_paths.mmd"
+        # Save diagram to file
+        with open(output_dir / filename, 'w') as f:
+            f.write(diagram)
+        console.print(f"[green]✓[/green] Generated diagram: {filename}")
+    except Exception as e:
+        console.print(f"[red]Error generating visualization: {str(e)}[/red]")
+        logger.exception("Error generating visualization")
\ No newline at end of file
@@ -70,11 +70,79 @@ class ExecutionPathAnalyzer:
         # Find triggers for this context
         triggers = self._find_triggers(object_name, context, metadata)
         for trigger in triggers:
+            # Cycle detection is per path; a trigger firing in several contexts
+            # (and the flows it reaches) belongs on each context's path
+            self.visited.clear()
             path = self._build_execution_path(trigger, metadata, depth=0)
             if path:
                 paths.append(path)
         return paths
     
+    def _find_triggers(
+        self,
+        object_name: str,
+        context: TriggerContext,
+        metadata: Dict
+    ) -> List[ExecutionNode]:
+        """
+            Find the triggers on an object that fire in a context.
+            
+            Reads the shared index from SFDXHelper.load_all_metadata, so no
+            source is read per object.
+        """
+        return [
+            ExecutionNode(
+                type=AutomationType.TRIGGER,
+                name=trigger['name'],
+                object_name=object_name,
+                context=context
+            )
+            for trigger in metadata.get('triggers', {}).get(object_name, ())
+            if context.value in trigger['contexts']
+        ]
+    
+    def _find_trigger_calls(self, node: ExecutionNode, metadata: Dict) -> List[ExecutionNode]:
+        """
+            Find the record-triggered flows that run in the same save as a trigger.
+            
+            Flows on the trigger's object that fire in the trigger's context come
+            from the shared index; Apex calls made by the trigger body are not
+            part of it.
+        """
+        return [
+            ExecutionNode(
+                type=AutomationType.FLOW,
+                name=flow['name'],
+                object_name=node.object_name,
+                context=node.context
+            )
+            for flow in metadata.get('flows', {}).get(node.object_name, ())
+            if node.context is not None and node.context.value in flow['contexts']
+        ]
+    
+    def _find_process_builder_actions(self, node: ExecutionNode, metadata: Dict) -> List[ExecutionNode]:
+        """
+            Find the flows a Process Builder process invokes.
+            
+            Processes are stored as flow metadata, so their flow actions are
+            indexed with the other flows' subflows.
+        """
+        return self._find_flow_elements(node, metadata)
+    
+    def _find_flow_elements(self, node: ExecutionNode, metadata: Dict) -> List[ExecutionNode]:
+        """
+            Find the flows a flow invokes as subflows or flow actions.
+        """
+        return [
+            ExecutionNode(
+                type=AutomationType.FLOW,
+                name=flow_name,
+                object_name=node.object_name,
+                context=node.context
+            )
+            for flow_name in metadata.get('subflows', {}).get(node.name, ())
+        ]
+    
     def _build_execution_path(
         self, 
         node: ExecutionNode, 
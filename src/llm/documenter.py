@@ -6,17 +6,33 @@
     model initialization, prompt generation, and response processing.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import logging
+import re
+import threading
 from dataclasses import dataclass
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
+from transformers import AutoTokenizer, AutoModelForCausalLM, TextIteratorStreamer
 from ..models.analysis_models import AnalysisResult, ExecutionNode
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Documentation sections in output order, keyed as yielded by stream_documentation
+DOCUMENTATION_SECTIONS = {
+    'overview': 'Overview',
+    'technical_details': 'Technical Details',
+    'business_impact': 'Business Impact',
+    'recommendations': 'Recommendations',
+}
+# A response line that only names a section, e.g. '## Business Impact' or '2. Recommendations:'
+_SECTION_HEADING_RE = re.compile(
+    r'^\s*(?:#+\s*|\d+[.)]\s*)?(' + '|'.join(DOCUMENTATION_SECTIONS.values()) + r')\s*:?\s*$',
+    re.IGNORECASE
+)
+_SECTION_KEYS = {title.lower(): key for key, title in DOCUMENTATION_SECTIONS.items()}
+
+@dataclass(slots=True)
 class DocumentationRequest:
     """
         Structure for documentation generation requests.
@@ -41,7 +57,7 @@ class DocumentationRequest:
     business_impact: Optional[str] = None
     existing_documentation: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class DocumentationResult:
     """
         Structure for generated documentation.
@@ -154,6 +170,97 @@ class LLMDocumenter:
             logger.error(f"Error generating documentation: {str(e)}")
             return self._generate_fallback_documentation(analysis_result)
             
+    def stream_documentation(self, analysis_result: AnalysisResult) -> Iterator[Tuple[str, str]]:
+        """
+            Generate documentation incrementally as the model produces it.
+            
+            Generation runs on a background thread and decoded text is yielded
+            line by line, so callers can write output before the response is
+            complete. Lines that only name a section switch the current section
+            and are not yielded; text before any heading belongs to 'overview'.
+            
+            Failures are handled like generate_documentation: if nothing has been
+            yielded yet, the basic fallback documentation is yielded instead;
+            otherwise a note that the output is incomplete closes the section.
+            
+            Args:
+                analysis_result: Analysis results to document
+                
+            Yields:
+                Tuple[str, str]: Section key from DOCUMENTATION_SECTIONS and a chunk of its text
+                
+            Example:
+                >>> for section, chunk in documenter.stream_documentation(analysis_result):
+                ...     print(section, chunk, end='')
+        """
+        try:
+            request = self._prepare_documentation_request(analysis_result)
+        except Exception as e:
+            logger.error(f"Error generating documentation: {str(e)}")
+            yield from self._stream_fallback_documentation(analysis_result)
+            return
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        errors: List[Exception] = []
+        
+        def generate():
+            try:
+                self.model.generate(
+                    **self._build_inputs(request),
+                    streamer=streamer,
+                    max_length=self.max_length,
+                    temperature=self.temperature,
+                    num_return_sequences=1
+                )
+            except Exception as e:
+                errors.append(e)
+                # Unblock the consumer, which would otherwise wait for more text
+                streamer.end()
+                
+        worker = threading.Thread(target=generate, daemon=True)
+        worker.start()
+        section = 'overview'
+        pending = ''
+        produced = False
+        for text in streamer:
+            pending += text
+            # Emit complete lines only, so headings are recognised whole
+            *lines, pending = pending.split('\n')
+            for line in lines:
+                heading = _SECTION_HEADING_RE.match(line)
+                if heading:
+                    section = _SECTION_KEYS[heading.group(1).lower()]
+                else:
+                    produced = True
+                    yield section, line + '\n'
+        worker.join()
+        if pending:
+            produced = True
+            yield section, pending
+        if errors:
+            logger.error(f"Error generating documentation: {str(errors[0])}")
+            if not produced:
+                # Nothing was written yet, so the basic documentation can stand in
+                yield from self._stream_fallback_documentation(analysis_result)
+            else:
+                # Mark the partial output rather than leaving it silently cut off
+                yield section, f"\n> Documentation generation failed: {str(errors[0])}. The text above is incomplete.\n"
+            
+    def _stream_fallback_documentation(self, analysis_result: AnalysisResult) -> Iterator[Tuple[str, str]]:
+        """
+            Yield the basic fallback documentation in stream_documentation's format.
+            
+            Args:
+                analysis_result: Analysis results to document
+                
+            Yields:
+                Tuple[str, str]: Section key and its full text
+        """
+        fallback = self._generate_fallback_documentation(analysis_result)
+        yield 'overview', fallback.overview + '\n'
+        yield 'technical_details', fallback.technical_details + '\n'
+        yield 'business_impact', fallback.business_impact + '\n'
+        yield 'recommendations', ''.join(f"- {rec}\n" for rec in fallback.recommendations)
+            
     def _prepare_documentation_request(self, analysis_result: AnalysisResult) -> DocumentationRequest:
         """
             Prepare the documentation request from analysis results.
@@ -188,21 +295,30 @@ class LLMDocumenter:
             Returns:
                 str: Raw LLM response
         """
-        # Prepare the prompt
-        prompt = self.prompt_template.format(
-            context=request.context,
-            technical_details=request.technical_details
-        )
-        # Generate response
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
         outputs = self.model.generate(
-            **inputs,
+            **self._build_inputs(request),
             max_length=self.max_length,
             temperature=self.temperature,
             num_return_sequences=1
         )
         return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         
+    def _build_inputs(self, request: DocumentationRequest):
+        """
+            Render the prompt for a request and tokenize it onto the model's device.
+            
+            Args:
+                request: Documentation generation request
+                
+            Returns:
+                BatchEncoding: Model inputs for generate()
+        """
+        prompt = self.prompt_template.format(
+            context=request.context,
+            technical_details=request.technical_details
+        )
+        return self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
+        
     def _process_llm_response(self, response: str) -> DocumentationResult:
         """
             Process the LLM response into structured documentation.
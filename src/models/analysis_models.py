@@ -61,7 +61,7 @@ class TriggerContext(Enum):
     AFTER_DELETE = 'after delete'
     AFTER_UNDELETE = 'after undelete'
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionNode:
     """
         Represents a node in the execution path.
@@ -95,7 +95,7 @@ class ExecutionNode:
     next_nodes: List['ExecutionNode'] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
         Contains the complete analysis results for an object.
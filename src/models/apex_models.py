@@ -43,7 +43,7 @@ class ApexModifier(Enum):
     WITHOUT_SHARING = 'without sharing'     # Bypasses sharing rules
     INHERITED_SHARING = 'inherited sharing' # Inherits sharing from caller
 
-@dataclass
+@dataclass(slots=True)
 class ApexAnnotation:
     """
         Represents an Apex annotation with its parameters.
@@ -64,7 +64,7 @@ class ApexAnnotation:
     name: str
     parameters: Dict[str, str] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ApexParameter:
     """
         Represents a parameter in an Apex method.
@@ -95,7 +95,7 @@ class ApexParameter:
     is_collection: bool = False
     collection_type: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class DMLOperation:
     """
         Represents a DML operation in Apex code.
@@ -126,7 +126,7 @@ class DMLOperation:
     is_bulk: bool
     line_number: int
 
-@dataclass
+@dataclass(slots=True)
 class SOQLQuery:
     """
         Represents a SOQL query in Apex code.
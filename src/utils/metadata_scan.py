@@ -0,0 +1,145 @@
+"""
+    Scanning helpers for Salesforce source trees.
+
+    This module provides the single-pass directory walk and the trigger header
+    decoding shared by the Apex analyzer and SFDXHelper's metadata index.
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directories that never hold project source and are not descended into
+# ('.apex_cache' is the analyzer's conventional parse cache location)
+SKIP_DIRS = frozenset({'.git', '.sf', '.sfdx', 'node_modules', '.apex_cache'})
+
+# Trigger header: name, object and comma-separated contexts.
+# Apex identifiers are ASCII; the pattern has no anchors, so MULTILINE is not needed.
+TRIGGER_HEADER_RE = re.compile(
+    rb'trigger\s+(?P<name>\w+)\s+on\s+(?P<object>\w+)\s*\('
+    rb'(?P<contexts>[^)]+)\)',
+    re.IGNORECASE | re.ASCII
+)
+# Bit assigned to each trigger context; a trigger's contexts are stored as a mask
+TRIGGER_CONTEXT_BITS = {
+    'before insert': 1 << 0,
+    'after insert': 1 << 1,
+    'before update': 1 << 2,
+    'after update': 1 << 3,
+    'before delete': 1 << 4,
+    'after delete': 1 << 5,
+    'before undelete': 1 << 6,
+    'after undelete': 1 << 7,
+}
+
+def iter_files(root: Path, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """
+        Walk a directory tree once, yielding paths of files with the given suffixes.
+        
+        Uses os.scandir with an explicit stack so file type checks come from the
+        directory listing itself rather than a separate stat per entry. Tool and
+        dependency directories listed in SKIP_DIRS are pruned. Directories
+        that are missing or cannot be read are skipped.
+        
+        Args:
+            root: Directory to walk
+            suffixes: File name suffixes to yield (e.g. ('.cls', '.trigger'))
+            
+        Yields:
+            str: Path of each matching file
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            # Missing or unreadable directories contribute no files
+            logger.debug(f"Skipping directory {directory}: {str(e)}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    yield entry.path
+
+def context_mask(contexts: str) -> int:
+    """
+        Pack a comma-separated trigger context list into a bitmask.
+        
+        Args:
+            contexts: Context list from a trigger header (e.g. 'before insert, after update')
+            
+        Returns:
+            int: Bitwise OR of the matching TRIGGER_CONTEXT_BITS values; unknown
+            contexts are logged and skipped
+    """
+    mask = 0
+    pos = 0
+    length = len(contexts)
+    # Walk the comma positions directly rather than materialising split() lists
+    while pos <= length:
+        comma = contexts.find(',', pos)
+        end = comma if comma != -1 else length
+        token = contexts[pos:end].strip().lower()
+        bit = TRIGGER_CONTEXT_BITS.get(token)
+        if bit is None:
+            # Tolerate irregular spacing such as 'before  insert'
+            bit = TRIGGER_CONTEXT_BITS.get(' '.join(token.split()))
+            if bit is None:
+                logger.warning(f"Skipping unknown trigger context: {token}")
+                bit = 0
+        mask |= bit
+        pos = end + 1
+    return mask
+
+def context_names(mask: int) -> Tuple[str, ...]:
+    """
+        Unpack a trigger context bitmask.
+        
+        Args:
+            mask: Bitmask produced by context_mask
+            
+        Returns:
+            Tuple[str, ...]: Contexts in canonical order (e.g. ('before insert', 'after update'))
+    """
+    return tuple(ctx for ctx, bit in TRIGGER_CONTEXT_BITS.items() if mask & bit)
+
+def context_str(mask: int) -> str:
+    """
+        Render a trigger context bitmask as a comma-separated list.
+        
+        Args:
+            mask: Bitmask produced by context_mask
+            
+        Returns:
+            str: Contexts in canonical order (e.g. 'before insert, after update')
+    """
+    return ', '.join(context_names(mask))
+
+def trigger_header(content: bytes) -> Optional[Tuple[str, str, int]]:
+    """
+        Decode the header of an Apex trigger.
+        
+        Args:
+            content: Raw trigger source
+            
+        Returns:
+            Optional[Tuple[str, str, int]]: Trigger name, object name and context
+            bitmask, None if the content has no trigger header
+            
+        Example:
+            >>> trigger_header(b'trigger AccountTrigger on Account (before insert) {}')
+            ('AccountTrigger', 'Account', 1)
+    """
+    match = TRIGGER_HEADER_RE.search(content)
+    if not match:
+        return None
+    name, object_name, contexts = (group.decode('ascii') for group in match.group('name', 'object', 'contexts'))
+    return name, object_name, context_mask(contexts)
@@ -0,0 +1,123 @@
+"""
+    On-disk cache for parsed source files.
+
+    This module provides a small pickle-backed cache used to skip re-parsing
+    Apex sources whose contents have not changed between runs. Entries are
+    keyed by a hash of the inputs that determine the parse result and are
+    written atomically so concurrent workers never observe partial files.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class ParseCache:
+    """
+        Pickle cache of parse results stored under a directory.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            version: Tag mixed into every key; change it to invalidate old entries
+
+        Example:
+            >>> cache = ParseCache(Path('.apex_cache'), version='1')
+            >>> key = cache.key(b'AccountService.cls', content)
+            >>> result = cache.get(key)
+            >>> if result is None:
+            ...     result = parse(content)
+            ...     cache.put(key, result)
+    """
+
+    def __init__(self, cache_dir: Path, version: str = '1'):
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+
+    def key(self, *parts: bytes) -> str:
+        """
+            Build a cache key from the inputs of a parse.
+
+            Args:
+                parts: Byte strings that together determine the parse result
+
+            Returns:
+                str: Hex digest identifying the entry
+        """
+        digest = hashlib.blake2b(self.version.encode(), digest_size=16)
+        for part in parts:
+            # Length-prefix each part so different splits never collide
+            digest.update(len(part).to_bytes(8, 'little'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Location of the entry for a key, sharded by its first two characters."""
+        return self.cache_dir / key[:2] / f"{key[2:]}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+            Load a cached result.
+
+            Args:
+                key: Key from key()
+
+            Returns:
+                Optional[Any]: Cached result, None on a miss or unreadable entry
+        """
+        try:
+            with open(self._entry_path(key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {key}: {str(e)}")
+            return None
+
+    def put(self, key: str, value: Any):
+        """
+            Store a result atomically.
+
+            The entry is written to a temporary file and moved into place with
+            os.replace. Failures are logged and otherwise ignored.
+
+            Args:
+                key: Key from key()
+                value: Picklable parse result
+        """
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {key}: {str(e)}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> int:
+        """
+            Remove every entry from the cache directory.
+
+            Entries written under another version are never read again, so
+            clearing is how their disk space is reclaimed. Only entry files
+            are removed; other files in the directory are left alone.
+
+            Returns:
+                int: Number of entries removed
+        """
+        removed = 0
+        for entry_path in self.cache_dir.glob('??/*.pkl'):
+            try:
+                entry_path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.debug(f"Could not remove cache entry {entry_path}: {str(e)}")
+        return removed
@@ -10,11 +10,84 @@ import subprocess
 from pathlib import Path
 import json
 import logging
-from typing import Dict, List, Optional, Union
+import os
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple, Union
 import yaml
+from .metadata_scan import context_names, iter_files, trigger_header
+from .parse_cache import ParseCache
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 logger = logging.getLogger(__name__)
 
+def config_cache_dir() -> Path:
+    """
+        Conventional per-user location of the parsed configuration cache,
+        for callers that opt in.
+        
+        Resolved on each call rather than at import, so the module stays
+        importable when no home directory can be determined.
+        
+        Returns:
+            Path: $XDG_CACHE_HOME/sfdoc, or ~/.cache/sfdoc
+    """
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'sfdoc'
+
+# Configuration files modified more recently than this are always parsed
+_CONFIG_RACY_WINDOW_NS = 2_000_000_000
+
+# Timing and record events of a record-triggered flow, from its <start> element,
+# combined into trigger context names such as 'before insert'
+_FLOW_TRIGGER_TIMING = {
+    'RecordBeforeSave': 'before',
+    'RecordAfterSave': 'after',
+    'RecordBeforeDelete': 'before',
+}
+_FLOW_RECORD_EVENTS = {
+    'Create': ('insert',),
+    'Update': ('update',),
+    'CreateAndUpdate': ('insert', 'update'),
+    'Delete': ('delete',),
+}
+
+def _read_flow(flow_file: str) -> Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]:
+    """
+        Read what the metadata index needs from a flow definition.
+        
+        Args:
+            flow_file: Path to a .flow-meta.xml file
+            
+        Returns:
+            Tuple: Object the flow is record-triggered on (None otherwise), the
+            trigger contexts it runs in, and the flows it invokes as subflows
+            or flow actions
+            
+        Raises:
+            OSError: If the file cannot be read
+            ET.ParseError: If the file is not well-formed XML
+    """
+    root = ET.parse(flow_file).getroot()
+    invoked = [subflow.findtext('{*}flowName') for subflow in root.iterfind('{*}subflows')]
+    invoked.extend(
+        action.findtext('{*}actionName') for action in root.iterfind('{*}actionCalls')
+        if action.findtext('{*}actionType') == 'flow'
+    )
+    start = root.find('{*}start')
+    object_name = start.findtext('{*}object') if start is not None else None
+    contexts: Tuple[str, ...] = ()
+    if object_name:
+        timing = _FLOW_TRIGGER_TIMING.get(start.findtext('{*}triggerType'))
+        events = _FLOW_RECORD_EVENTS.get(start.findtext('{*}recordTriggerType'), ())
+        if timing:
+            contexts = tuple(f"{timing} {event}" for event in events)
+    return object_name or None, contexts, tuple(dict.fromkeys(name for name in invoked if name))
+
 class SFDXHelper:
     """
         Helper class for interacting with Salesforce DX projects.
@@ -34,18 +107,25 @@ class SFDXHelper:
     
     def __init__(self, project_path: Path):
         self.project_path = project_path
+        self._validated = False
         self._validate_sfdx_project()
         
     def _validate_sfdx_project(self):
         """
             Validate that the path contains a valid SFDX project.
             
+            Only the first successful call checks the file system; later
+            calls on the same helper return immediately.
+            
             Raises:
                 ValueError: If sfdx-project.json is not found
         """
+        if self._validated:
+            return
         sfdx_project_path = self.project_path / 'sfdx-project.json'
         if not sfdx_project_path.exists():
             raise ValueError(f"No sfdx-project.json found in {self.project_path}")
+        self._validated = True
             
     def get_metadata(self, metadata_type: str) -> List[Dict]:
         """
@@ -151,6 +231,60 @@ class SFDXHelper:
     </types>""")
         return '\n'.join(types_xml)
     
+    def load_all_metadata(self, source_path: Optional[Path] = None) -> Dict[str, Dict]:
+        """
+            Index the retrieved triggers, flows and objects in one walk.
+            
+            Built once per run and shared across objects, so analyzing each
+            object only filters this index instead of re-reading source files.
+            
+            Args:
+                source_path: Directory holding retrieved source
+                            Defaults to force-app directory in project
+            
+            Returns:
+                Dict[str, Dict]: 'triggers' and 'flows' map an object name to its
+                triggers and record-triggered flows, each with the contexts it runs
+                in; 'subflows' maps every flow name to the flows it invokes;
+                'objects' maps an object name to its metadata file
+                
+            Example:
+                >>> metadata = helper.load_all_metadata()
+                >>> metadata['triggers']['Account']
+                [{'name': 'AccountTrigger', 'contexts': ('before insert', 'after update')}]
+                >>> metadata['flows']['Account']
+                [{'name': 'Account_After_Save', 'contexts': ('after insert',)}]
+        """
+        source_path = source_path or self.project_path / 'force-app'
+        metadata: Dict[str, Dict] = {'triggers': {}, 'flows': {}, 'subflows': {}, 'objects': {}}
+        for file_path in iter_files(source_path, ('.trigger', '.flow-meta.xml', '.object-meta.xml')):
+            file_name = Path(file_path).name
+            try:
+                if file_name.endswith('.trigger'):
+                    with open(file_path, 'rb') as f:
+                        header = trigger_header(f.read())
+                    if header:
+                        name, object_name, contexts = header
+                        metadata['triggers'].setdefault(object_name, []).append({
+                            'name': name,
+                            'contexts': context_names(contexts)
+                        })
+                elif file_name.endswith('.flow-meta.xml'):
+                    flow_name = file_name[:-len('.flow-meta.xml')]
+                    object_name, contexts, invoked = _read_flow(file_path)
+                    if contexts:
+                        metadata['flows'].setdefault(object_name, []).append({
+                            'name': flow_name,
+                            'contexts': contexts
+                        })
+                    if invoked:
+                        metadata['subflows'][flow_name] = invoked
+                else:
+                    metadata['objects'][file_name[:-len('.object-meta.xml')]] = Path(file_path)
+            except (OSError, ET.ParseError) as e:
+                logger.warning(f"Skipping unreadable metadata file {file_path}: {str(e)}")
+        return metadata
+    
     def get_org_metadata_info(self) -> Dict:
         """
             Get information about all metadata types in the org.
@@ -185,6 +319,8 @@ class ConfigManager:
         Args:
             config_path: Optional path to configuration file
                         Defaults to 'config/default_config.yaml'
+            cache_dir: Directory caching parsed configuration, None (the default)
+                       to disable caching; see config_cache_dir()
         
         Raises:
             FileNotFoundError: If configuration file not found
@@ -196,14 +332,21 @@ class ConfigManager:
             >>> config_manager.update_config({'analysis': {'new_setting': True}})
     """
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, cache_dir: Optional[Path] = None):
         self.config_path = config_path or Path('config/default_config.yaml')
+        self.cache = ParseCache(cache_dir, version='config-1') if cache_dir is not None else None
         self.config = self.load_config()
         
     def load_config(self) -> Dict:
         """
             Load and validate configuration from YAML file.
             
+            With a cache configured, the validated configuration is stored keyed
+            by the file's path, modification time and size, and reused while
+            those are unchanged. Files modified within the last couple of
+            seconds are always parsed, since they may change again without
+            their modification time moving.
+            
             Returns:
                 Dict: Validated configuration dictionary
                 
@@ -217,13 +360,27 @@ class ConfigManager:
                 >>> print(config['analysis']['parser'])
                 {'include_inner_classes': True, ...}
         """
-        if not self.config_path.exists():
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
             
+        key = None
+        if self.cache is not None and time.time_ns() - stat.st_mtime_ns >= _CONFIG_RACY_WINDOW_NS:
+            key = self.cache.key(
+                os.fsencode(os.path.abspath(self.config_path)),
+                b'%d:%d' % (stat.st_mtime_ns, stat.st_size)
+            )
+            config = self.cache.get(key)
+            if config is not None:
+                return config
+            
         with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
             
         self._validate_config(config)
+        if key is not None:
+            self.cache.put(key, config)
         return config
     
     def _validate_config(self, config: Dict):